@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import secrets
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
@@ -14,6 +16,7 @@ from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from src.core.config import settings
 from src.core.handler import init as init_exception_handlers
 from src.core.logging import configure_logging, get_logger
+from src.core.middlewares.clock import RequestClockMiddleware
 from src.core.middlewares.logging import LoggingMiddleware
 from src.core.middlewares.security import MaxRequestSizeMiddleware, SecurityHeadersMiddleware
 from src.modules.auth.router import router as auth_router
@@ -57,6 +60,7 @@ middleware_list: list[Middleware] = [
     Middleware(SecurityHeadersMiddleware),  # ty:ignore[invalid-argument-type]
     Middleware(MaxRequestSizeMiddleware, max_upload_size=5 * 1024 * 1024),  # ty:ignore[invalid-argument-type]
     Middleware(LoggingMiddleware),  # ty:ignore[invalid-argument-type]
+    Middleware(RequestClockMiddleware),  # ty:ignore[invalid-argument-type]
 ]
 
 if settings.BACKEND_CORS_ORIGINS:
@@ -107,23 +111,35 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
 
     Startup:
         - Initialize countries cache (prevents blocking I/O during validation)
+        - Subscribe to user cache invalidations published by other workers
 
     Shutdown:
-        - No cleanup needed
+        - Stop the user cache invalidation listener
+        - Close the shared Redis connection pool
     """
     # Startup
     logger.info("Application startup: Initializing resources...")
 
+    from src.core.services.redis_service import redis_service
+    from src.modules.auth.dependencies import listen_for_user_cache_invalidations
     from src.modules.countries.service import initialize_countries_cache
 
-    initialize_countries_cache()
+    await initialize_countries_cache()
     logger.info("Countries cache initialized successfully")
 
+    user_cache_listener = asyncio.create_task(listen_for_user_cache_invalidations(redis_service))
+
     yield
 
     # Shutdown
     logger.info("Application shutdown: Cleaning up resources...")
 
+    user_cache_listener.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await user_cache_listener
+
+    await redis_service.close()
+
 
 def custom_openapi() -> dict[str, Any]:
     """Custom OpenAPI schema with Bearer authentication support."""
@@ -1,8 +1,19 @@
+import asyncio
+from collections.abc import Coroutine
+from types import ModuleType
+from typing import Any
+
 from celery import Celery
 from celery.schedules import crontab
 
 from src.core.config import settings
 
+uvloop: ModuleType | None
+try:
+    import uvloop
+except ImportError:  # uvloop doesn't support Windows
+    uvloop = None
+
 celery_app: Celery = Celery("celery_worker", broker=settings.REDIS_URL, backend=settings.REDIS_URL)
 
 celery_app.conf.update(
@@ -17,10 +28,26 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,
 )
 
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a task coroutine to completion in a fresh event loop.
+
+    Uses uvloop when it is installed (it ships with uvicorn[standard]), matching
+    the loop uvicorn picks for the web workers.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    return asyncio.run(coro, loop_factory=uvloop.new_event_loop if uvloop else None)
+
+
 # Celery Beat Schedule
 celery_app.conf.beat_schedule = {
     "cleanup-expired-tokens-daily": {
-        "task": "tasks.cleanup_expired_tokens",
+        "task": "auth.cleanup_expired_refresh_tokens",
         "schedule": crontab(hour=2, minute=0),  # Run daily at 2 AM
         "options": {
             "expires": 3600,
@@ -36,4 +63,4 @@ celery_app.conf.beat_schedule = {
 }
 
 # Auto-discover tasks from modules
-celery_app.autodiscover_tasks(["src.core", "src.modules.auth"])
+celery_app.autodiscover_tasks(["src.core", "src.modules.auth", "src.modules.chatbot"])
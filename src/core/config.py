@@ -38,6 +38,7 @@ class Settings(BaseSettings):
     )
 
     GEMINI_CHAT_MODEL: str = Field(description="Gemini model for chatbot", default="gemini-3-flash-preview")
+    GEMINI_MAX_CONCURRENCY: int = Field(default=50, description="Max concurrent chat streams to Gemini per process")
     CHAT_RATE_LIMIT_PER_MINUTE: int = Field(default=10, description="Max chat messages per minute per user")
     CHAT_DAILY_MESSAGE_LIMIT: int = Field(default=100, description="Max chat messages per day per user")
     CHAT_MAX_FILE_SIZE_MB: int = Field(default=20, description="Max file upload size in MB")
@@ -45,6 +46,9 @@ class Settings(BaseSettings):
     CHAT_SUMMARY_TRIGGER_COUNT: int = Field(
         default=50, description="Create summary after this many messages in a thread"
     )
+    CHAT_SUMMARY_DEBOUNCE_SECONDS: int = Field(
+        default=600, description="Queue at most one summary per thread within this many seconds"
+    )
     CHAT_HEALTH_CONTEXT_DAYS: int = Field(default=7, description="Days of health data to include in chat context")
     CHAT_MODERATION_ENABLED: bool = Field(default=True, description="Enable AI content moderation")
 
@@ -70,6 +74,7 @@ class Settings(BaseSettings):
     # Google Cloud Storage Configuration
     PUBLIC_BUCKET_NAME: str = Field(default="public-bucket", description="GCS public bucket name")
     PRIVATE_BUCKET_NAME: str = Field(default="private-bucket", description="GCS private bucket name")
+    STORAGE_HEALTHCHECK_ENABLED: bool = Field(default=True, description="Include GCS in the full health check")
 
     ENABLE_DOCS: bool = Field(default=True)
     USE_AI_REVISION: bool = Field(default=True, description="Enable AI-powered daily workout revision analysis")
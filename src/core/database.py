@@ -1,5 +1,7 @@
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import Any
 
 from sqlalchemy import DateTime, func
 from sqlalchemy.ext.asyncio import (
@@ -9,10 +11,28 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import NullPool
 
 from src.core.config import settings
+from src.core.utils.serialization import json_dumps, json_loads
 
-engine: AsyncEngine = create_async_engine(url=settings.DATABASE_URL, echo=False, future=True)
+
+def _json_serializer(obj: Any) -> str:
+    """Encode JSON/JSONB bind values with the fast codec (asyncpg expects text)."""
+    return json_dumps(obj).decode()
+
+
+engine: AsyncEngine = create_async_engine(
+    url=settings.DATABASE_URL,
+    echo=False,
+    future=True,
+    json_serializer=_json_serializer,
+    json_deserializer=json_loads,
+    # Repository queries already bind every value, so the SQL text of each query shape is stable and
+    # asyncpg can reuse its server-side prepared statement. Optional filters multiply those shapes, so
+    # keep more of them prepared per connection than the default 100.
+    connect_args={"prepared_statement_cache_size": 500},
+)
 
 AsyncSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
@@ -43,3 +63,23 @@ async def get_db() -> AsyncGenerator[AsyncSession]:
             raise
         finally:
             await session.close()
+
+
+@asynccontextmanager
+async def task_session() -> AsyncGenerator[AsyncSession]:
+    """Session for work running in its own event loop (e.g. Celery tasks via asyncio.run).
+
+    Pooled asyncpg connections are bound to the loop that created them, so this
+    uses a throwaway NullPool engine instead of the application's shared engine.
+    """
+    task_engine = create_async_engine(
+        url=settings.DATABASE_URL,
+        poolclass=NullPool,
+        json_serializer=_json_serializer,
+        json_deserializer=json_loads,
+    )
+    try:
+        async with AsyncSession(bind=task_engine, expire_on_commit=False, autoflush=False) as session:
+            yield session
+    finally:
+        await task_engine.dispose()
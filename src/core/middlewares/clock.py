@@ -0,0 +1,30 @@
+from datetime import UTC, datetime
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.utils.clock import reset_request_now, set_request_now
+
+
+class RequestClockMiddleware:
+    """Capture the request start time once and expose it as request.state.now.
+
+    Implemented as a plain ASGI middleware (no BaseHTTPMiddleware task/stream
+    wrapping) because it only needs to set a context variable around the call.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        now = datetime.now(UTC)
+        scope.setdefault("state", {})["now"] = now
+
+        token = set_request_now(now)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_request_now(token)
@@ -2,7 +2,7 @@
 
 import uuid
 
-from sqlalchemy import Boolean, Enum, String, Uuid
+from sqlalchemy import Boolean, Enum, Index, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
@@ -33,10 +33,15 @@ class BaseUser(Base):
         default=AuthProviderEnum.EMAIL,
         nullable=False,
     )
-    social_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    social_id: Mapped[str | None] = mapped_column(String, nullable=True)
 
     # Status
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     notification_enabled: Mapped[bool] = mapped_column(Boolean, default=True)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False)
     timezone: Mapped[str] = mapped_column(String, default="UTC", nullable=False)
+
+    __table_args__ = (
+        # Social login lookup (provider + social ID); also covers lookups by social_id alone
+        Index("ix_users_social_id_provider", "social_id", "provider"),
+    )
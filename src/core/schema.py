@@ -1,9 +1,11 @@
+import re
 from datetime import datetime
 from enum import Enum, IntEnum
 from typing import Annotated
 
 from fastapi import Path
 from pydantic import (
+    AfterValidator,
     BaseModel,
     BeforeValidator,
     ConfigDict,
@@ -18,6 +20,23 @@ ObjectIdPath = Annotated[str, Path(min_length=24, max_length=24)]
 
 UuidKey = Annotated[str, BeforeValidator(str)]
 
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def _fast_email_check(value: str) -> str:
+    """Cheap shape check for emails that are only used as lookup keys.
+
+    Lowercases the domain only, matching how EmailStr normalizes stored addresses.
+    """
+    if not _EMAIL_RE.fullmatch(value):
+        raise ValueError("value is not a valid email address")
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+# Use for read paths (login, code verification); keep EmailStr where addresses are stored
+EmailStrFast = Annotated[str, AfterValidator(_fast_email_check)]
+
 
 class BaseSchema(BaseModel):
     model_config = ConfigDict(
@@ -1,13 +1,23 @@
 import base64
+import functools
 import hashlib
+import re
 import secrets
-from datetime import UTC, datetime, timedelta
+import time
+from datetime import datetime, timedelta
 from typing import Any, Union
 
 import jwt
 from passlib.context import CryptContext
 
 from src.core.config import settings
+from src.core.utils.cache import TTLCache
+from src.core.utils.clock import utc_now
+
+# token_urlsafe(32) yields 43 base64url characters; allow some headroom for longer tokens
+REFRESH_TOKEN_RE = re.compile(r"[A-Za-z0-9_-]{43,64}")
+# Compact JWS: three base64url segments (signature may be empty only for unsigned tokens)
+JWT_RE = re.compile(r"[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]*")
 
 
 class SecurityService:
@@ -16,19 +26,50 @@ class SecurityService:
         self.secret_key: str = settings.SECRET_KEY
         self.algorithm: str = settings.ALGORITHM
         self.access_token_expire_minutes: int = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+        # Reusable decoder: options are merged once here instead of on every jwt.decode call
+        self._jwt = jwt.PyJWT(options={"require": ["exp", "sub"]})
+        self._algorithms: list[str] = [self.algorithm]
+        # Verified access-token payloads keyed by token digest; entries are also bounded by "exp"
+        self._payload_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(maxsize=10_000, ttl=60)
 
     def create_access_token(
         self, subject: Union[str, Any], expires_delta: timedelta | None = None, extra_data: dict[str, Any] | None = None
     ) -> str:
         if expires_delta:
-            expire = datetime.now(UTC) + expires_delta
+            expire = utc_now() + expires_delta
         else:
-            expire: datetime = datetime.now(UTC) + timedelta(minutes=self.access_token_expire_minutes)
+            expire: datetime = utc_now() + timedelta(minutes=self.access_token_expire_minutes)
         to_encode = {"sub": str(subject), "exp": expire}
         if extra_data:
             to_encode.update(extra_data)
         return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
 
+    def decode_access_token(self, token: str) -> dict[str, Any]:
+        """Verify and decode an access token, reusing recently verified payloads.
+
+        Access tokens are not revocable server-side, so a cached payload is
+        valid until its own expiry.
+
+        Raises:
+            InvalidTokenError: If the signature or claims are invalid
+        """
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        payload = self._payload_cache.get(key)
+        if payload is not None and payload.get("exp", 0) > time.time():
+            return payload
+
+        payload = self.decode_token(token)
+        self._payload_cache.set(key, payload)
+        return payload
+
+    def decode_token(self, token: str) -> dict[str, Any]:
+        """Verify and decode a JWT issued by this service (requires "exp" and "sub").
+
+        Raises:
+            InvalidTokenError: If the signature or claims are invalid
+        """
+        return self._jwt.decode(token, self.secret_key, algorithms=self._algorithms)
+
     def prehash_password(self, password: str) -> str:
         """SHA-256 ile ön hashleme yaparak bcrypt 72 bayt limitini aşar."""
         sha256_hash: bytes = hashlib.sha256(password.encode()).digest()
@@ -42,17 +83,37 @@ class SecurityService:
         prehashed: str = self.prehash_password(password)
         return self.pwd_context.hash(prehashed)
 
+    @functools.cached_property
+    def _dummy_password_hash(self) -> str:
+        return self.get_password_hash(secrets.token_urlsafe(16))
+
+    def verify_dummy_password(self, plain_password: str) -> bool:
+        """Run a bcrypt check against a throwaway hash so misses cost the same as real checks."""
+        return self.verify_password(plain_password, self._dummy_password_hash)
+
     def create_refresh_token(self) -> str:
         """Generate cryptographically secure random refresh token."""
         return secrets.token_urlsafe(32)
 
+    def is_refresh_token_format(self, token: str) -> bool:
+        """Cheap shape check so malformed tokens are rejected before hashing or lookups."""
+        return REFRESH_TOKEN_RE.fullmatch(token) is not None
+
+    def is_jwt_format(self, token: str) -> bool:
+        """Cheap shape check for compact JWTs before signature verification."""
+        return JWT_RE.fullmatch(token) is not None
+
     def hash_token(self, token: str) -> str:
-        """Hash token using SHA-256 before storing in database."""
+        """Hash token using SHA-256 before storing in database.
+
+        hashlib's SHA-256 is OpenSSL-backed (SHA-NI where available), so a
+        single call per request costs well under a microsecond for a 43-char token.
+        """
         return hashlib.sha256(token.encode()).hexdigest()
 
     def verify_token_hash(self, token: str, token_hash: str) -> bool:
-        """Verify token against stored hash."""
-        return self.hash_token(token) == token_hash
+        """Verify token against stored hash (constant-time comparison)."""
+        return secrets.compare_digest(self.hash_token(token), token_hash)
 
 
 security_service: SecurityService = SecurityService()
@@ -64,7 +64,7 @@ class AIService:
     AI Service for generating content using Google Gemini.
 
     Note: Creates a new Client per request to avoid event loop issues
-    when used with Celery's asyncio.run() which creates fresh event loops.
+    when used with Celery's run_async() which creates fresh event loops.
     """
 
     async def generate(self, prompt: str) -> dict:
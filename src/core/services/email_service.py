@@ -37,6 +37,11 @@ class EmailService:
 
         logger.info(f"Email service initialized (mock={self.use_mock})")
 
+    async def close(self):
+        """Close the underlying HTTP client."""
+        if not self.use_mock:
+            await self.client.aclose()
+
     def _render_template(self, template_name: str, **context) -> str:
         """Render email template with given context."""
         try:
@@ -1,24 +1,67 @@
-import json
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta
 
-from dateutil.tz import UTC
 from redis.asyncio import Redis
 
 from src.core.config import settings
+from src.core.utils.clock import utc_now
+
+# Compares a one-time code and tracks failed attempts atomically in one round-trip.
+# Returns -1 if no code is stored, 0 on a match (code consumed), otherwise the failed attempt count.
+CHECK_CODE_SCRIPT = """
+local stored = redis.call('GET', KEYS[1])
+if not stored then
+    return -1
+end
+if stored == ARGV[1] then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return 0
+end
+local attempts = redis.call('INCR', KEYS[2])
+if attempts == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+if attempts >= tonumber(ARGV[3]) then
+    redis.call('DEL', KEYS[1], KEYS[2])
+end
+return attempts
+"""
 
 
 class RedisService:
     def __init__(self):
         self.client = Redis.from_url(settings.REDIS_URL, encoding="utf-8", decode_responses=True)
+        self._check_code_script = self.client.register_script(CHECK_CODE_SCRIPT)
 
     async def set(self, key: str, value: str | int, expire: int | timedelta):
         """Set value in Redis."""
         await self.client.set(key, value, ex=expire)
 
+    async def set_many(self, mapping: dict[str, str | int], expire: int | timedelta):
+        """Set several values with the same TTL in a single pipelined round-trip."""
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=expire)
+            await pipe.execute()
+
+    async def set_if_absent(self, key: str, value: str | int, expire: int | timedelta) -> bool:
+        """Atomically set value only if key does not exist (SET NX EX).
+
+        Returns:
+            bool: True if the key was set, False if it already existed
+        """
+        return bool(await self.client.set(key, value, ex=expire, nx=True))
+
     async def get(self, key: str) -> str | None:
         """Get value from Redis."""
         return await self.client.get(key)
 
+    async def get_many(self, keys: list[str]) -> list[str | None]:
+        """Get several values in a single MGET round-trip (None for missing keys)."""
+        if not keys:
+            return []
+        return await self.client.mget(keys)
+
     async def delete(self, *keys: str):
         """Delete keys from Redis."""
         if keys:
@@ -32,10 +75,53 @@ class RedisService:
         """Expire key in Redis."""
         await self.client.expire(key, time)
 
+    async def ping(self) -> bool:
+        """Check connectivity with a PING over the shared connection pool."""
+        return bool(await self.client.ping())
+
     async def close(self):
         """Close Redis connection."""
         await self.client.close()
 
+    async def publish(self, channel: str, message: str) -> None:
+        """Publish message to a Redis pub/sub channel."""
+        await self.client.publish(channel, message)
+
+    async def listen(self, channel: str) -> AsyncIterator[str]:
+        """Yield messages published to a Redis pub/sub channel until cancelled."""
+        pubsub = self.client.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield message["data"]
+        finally:
+            await pubsub.aclose()
+
+    async def check_code(
+        self,
+        code_key: str,
+        attempt_key: str,
+        input_code: str,
+        expire: int | timedelta,
+        max_attempts: int,
+    ) -> int:
+        """
+        Checks a one-time code and records a failed attempt in a single atomic call.
+
+        Args:
+            code_key: Redis key holding the code
+            attempt_key: Redis key counting failed attempts
+            input_code: Code submitted by the user
+            expire: TTL applied to the code after the first failed attempt
+            max_attempts: Failed attempts after which the code is deleted
+
+        Returns:
+            int: -1 if no code is stored, 0 if the code matched, otherwise the failed attempt count
+        """
+        ttl = int(expire.total_seconds()) if isinstance(expire, timedelta) else expire
+        return int(await self._check_code_script(keys=[code_key, attempt_key], args=[input_code, ttl, max_attempts]))
+
     async def check_rate_limit(self, key: str, limit: int, window: int) -> bool:
         """
         Checks the rate limit for the specified key.
@@ -56,41 +142,16 @@ class RedisService:
 
         return current_count <= limit
 
-    async def cache_refresh_token(
-        self,
-        token_hash: str,
-        user_id: str,
-        device_id: str | None,
-        expires_at: datetime,
-    ) -> None:
-        """Cache refresh token metadata for fast validation."""
-        key = f"refresh_token:{token_hash}"
-        value = json.dumps(
-            {
-                "user_id": user_id,
-                "device_id": device_id,
-                "expires_at": expires_at.isoformat(),
-            }
-        )
-
-        ttl = int((expires_at - datetime.now(tz=UTC)).total_seconds())
+    async def mark_token_used(self, token_hash: str, token_id: str, expires_at: datetime) -> None:
+        """Remember a rotated refresh token until it would have expired (for reuse detection)."""
+        ttl = int((expires_at - utc_now()).total_seconds())
 
         if ttl > 0:
-            await self.set(key, value, expire=ttl)
-
-    async def get_cached_token(self, token_hash: str) -> dict | None:
-        """Get cached token metadata."""
-        key = f"refresh_token:{token_hash}"
-        value = await self.get(key)
-
-        if value:
-            return json.loads(value)
-        return None
+            await self.set(f"auth:used:{token_hash}", token_id, expire=ttl)
 
-    async def invalidate_token_cache(self, token_hash: str) -> None:
-        """Remove token from cache (on revoke)."""
-        key = f"refresh_token:{token_hash}"
-        await self.delete(key)
+    async def get_used_token_id(self, token_hash: str) -> str | None:
+        """Get the id of an already rotated refresh token, if this hash was used before."""
+        return await self.get(f"auth:used:{token_hash}")
 
 
 redis_service = RedisService()
@@ -1,4 +1,6 @@
+import asyncio
 import base64
+import hashlib
 import json
 import logging
 import uuid
@@ -10,15 +12,32 @@ from google.cloud import storage as gcs_storage
 from google.oauth2 import service_account
 
 from src.core.config import settings
+from src.core.services.redis_service import redis_service
+from src.core.utils.cache import TTLCache
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Resumable uploads send the file in chunks of this size (must be a multiple of 256 KiB),
+# so at most one chunk is held in memory instead of the client's 100 MiB default buffer.
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+SIGNED_URL_CACHE_PREFIX = "storage:signed_url"
+
+# Per-process cache in front of Redis; kept short so URLs handed out keep most of their validity
+SIGNED_URL_LOCAL_CACHE_TTL_SECONDS = 60
+
+
+def _signed_url_cache_key(file_url: str, expiration_minutes: int) -> str:
+    digest = hashlib.sha1(file_url.encode(), usedforsecurity=False).hexdigest()
+    return f"{SIGNED_URL_CACHE_PREFIX}:{digest}:{expiration_minutes}"
+
 
 class StorageService:
     def __init__(self):
         self.public_bucket_name: str = settings.PUBLIC_BUCKET_NAME
         self.private_bucket_name: str = settings.PRIVATE_BUCKET_NAME
         self._client = None
+        self._signed_url_cache: TTLCache[str, str] = TTLCache(maxsize=4096, ttl=SIGNED_URL_LOCAL_CACHE_TTL_SECONDS)
 
     @property
     def client(self):
@@ -53,7 +72,14 @@ class StorageService:
 
         return self._client
 
-    def _upload_sync(self, file_obj: BinaryIO, object_name: str, content_type: str, bucket_name: str) -> str:
+    def _upload_sync(
+        self,
+        file_obj: BinaryIO,
+        object_name: str,
+        content_type: str,
+        bucket_name: str,
+        size: int | None = None,
+    ) -> str:
         """Upload a file to GCS synchronously.
 
         Args:
@@ -61,6 +87,7 @@ class StorageService:
             object_name: Path/name in bucket
             content_type: MIME type
             bucket_name: Target bucket name
+            size: Number of bytes to upload, if known
 
         Returns:
             Full GCS URL of uploaded file
@@ -71,11 +98,14 @@ class StorageService:
             file_obj.seek(0)
 
             bucket = self.client.bucket(bucket_name)
-            blob = bucket.blob(object_name)
+            blob = bucket.blob(object_name, chunk_size=UPLOAD_CHUNK_SIZE)
 
+            # A known size lets small files go up in one multipart request instead of
+            # opening a resumable session first
             blob.upload_from_file(
                 file_obj,
                 content_type=content_type,
+                size=size,
             )
             url = f"https://storage.googleapis.com/{bucket_name}/{object_name}"
             logger.info(f"Upload successful: {url}")
@@ -92,15 +122,17 @@ class StorageService:
         content_type: str,
         folder: str = "avatars",
         use_private: bool = False,
+        size: int | None = None,
     ) -> str:
         """Upload a file to GCS and return its URL.
 
         Args:
-            file_obj: File to upload
+            file_obj: File to upload; read in chunks, never copied into memory as a whole
             filename: Original filename
             content_type: MIME type
             folder: Folder path in bucket
             use_private: If True, upload to private bucket, else public bucket
+            size: Number of bytes to upload, if known
 
         Returns:
             Full GCS URL of uploaded file
@@ -110,7 +142,7 @@ class StorageService:
 
         bucket_name = self.private_bucket_name if use_private else self.public_bucket_name
 
-        url: str = await run_in_threadpool(self._upload_sync, file_obj, unique_name, content_type, bucket_name)
+        url: str = await run_in_threadpool(self._upload_sync, file_obj, unique_name, content_type, bucket_name, size)
         return url
 
     async def delete_file(self, file_url: str):
@@ -168,7 +200,8 @@ class StorageService:
     async def generate_signed_url(self, file_url: str, expiration_minutes: int = 60) -> str:
         """Generate a signed URL for secure file access.
 
-        Automatically detects which bucket the file is in from the URL.
+        Automatically detects which bucket the file is in from the URL. Signed URLs
+        are cached in Redis, see generate_signed_urls.
 
         Args:
             file_url: Full GCS URL (e.g., https://storage.googleapis.com/bucket/path/file.jpg)
@@ -183,6 +216,63 @@ class StorageService:
                 expiration_minutes=120
             )
         """
+        [url] = await self.generate_signed_urls([file_url], expiration_minutes)
+        return url
+
+    async def generate_signed_urls(self, file_urls: list[str], expiration_minutes: int = 60) -> list[str]:
+        """Generate signed URLs for several files, reusing recently signed ones.
+
+        URLs are looked up in a short-lived per-process cache, then with one MGET
+        in Redis, and only the misses are signed, concurrently. Redis entries live
+        for half the URL lifetime, so a cached URL is always handed out with close
+        to half of its validity left.
+
+        Args:
+            file_urls: Full GCS URLs
+            expiration_minutes: URL validity duration in minutes (default: 60)
+
+        Returns:
+            Signed URLs in the same order as file_urls
+        """
+        if not file_urls:
+            return []
+
+        keys = [_signed_url_cache_key(file_url, expiration_minutes) for file_url in file_urls]
+        urls: list[str | None] = [self._signed_url_cache.get(key) for key in keys]
+
+        remote = [i for i, url in enumerate(urls) if url is None]
+        if remote:
+            try:
+                cached = await redis_service.get_many([keys[i] for i in remote])
+            except Exception as e:
+                logger.warning(f"Signed URL cache lookup failed: {e}")
+                cached = [None] * len(remote)
+
+            for i, url in zip(remote, cached, strict=True):
+                if url is not None:
+                    urls[i] = url
+                    self._signed_url_cache.set(keys[i], url)
+
+        misses = [i for i, url in enumerate(urls) if url is None]
+        if misses:
+            signed = await asyncio.gather(*(self._sign_url(file_urls[i], expiration_minutes) for i in misses))
+            for i, url in zip(misses, signed, strict=True):
+                urls[i] = url
+                self._signed_url_cache.set(keys[i], url)
+
+            try:
+                await redis_service.set_many(
+                    {keys[i]: signed_url for i, signed_url in zip(misses, signed, strict=True)},
+                    expire=expiration_minutes * 60 // 2,
+                )
+            except Exception as e:
+                logger.warning(f"Signed URL cache write failed: {e}")
+
+        # Every miss was signed above, so nothing is filtered out here
+        return [url for url in urls if url is not None]
+
+    async def _sign_url(self, file_url: str, expiration_minutes: int) -> str:
+        """Sign a single URL without consulting the cache."""
         # Detect bucket and extract object name from full URL
         if self.private_bucket_name in file_url:
             bucket_name = self.private_bucket_name
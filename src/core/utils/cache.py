@@ -0,0 +1,63 @@
+"""In-process caching utilities.
+
+Provides a small TTL-bounded LRU cache for hot lookups that should
+avoid a network round-trip (Redis/PostgreSQL) on every request.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class TTLCache[K, V]:
+    """Least-recently-used cache whose entries expire after a fixed TTL.
+
+    Not thread-safe; intended for use from a single event loop per process.
+
+    Example:
+        cache: TTLCache[str, User] = TTLCache(maxsize=10_000, ttl=60)
+        cache.set("key", value)
+        value = cache.get("key")
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        """Get value if present and not expired."""
+        item = self._data.get(key)
+        if item is None:
+            return default
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store value, evicting the least recently used entry when full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K, default: Any = None) -> V | Any:
+        """Remove key and return its value (expired or not)."""
+        item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,26 @@
+"""Request-scoped clock.
+
+A single UTC timestamp is captured when an HTTP request enters the app and
+reused for every expiry/revocation comparison made while serving it, so all
+rows written by one request share the same instant.
+"""
+
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime
+
+_request_now: ContextVar[datetime | None] = ContextVar("request_now", default=None)
+
+
+def utc_now() -> datetime:
+    """Return the current request's timestamp, or the wall clock outside a request."""
+    return _request_now.get() or datetime.now(UTC)
+
+
+def set_request_now(now: datetime) -> Token[datetime | None]:
+    """Pin utc_now() to the given timestamp for the current context."""
+    return _request_now.set(now)
+
+
+def reset_request_now(token: Token[datetime | None]) -> None:
+    """Restore the value of utc_now() that was active before set_request_now()."""
+    _request_now.reset(token)
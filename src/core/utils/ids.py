@@ -0,0 +1,22 @@
+"""Identifier helpers."""
+
+import secrets
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds, so consecutive ids
+    land on the rightmost B-tree leaf instead of random index pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76  # version
+        | secrets.randbits(12) << 64
+        | 0b10 << 62  # RFC 4122 variant
+        | secrets.randbits(62)
+    )
+    return uuid.UUID(int=value)
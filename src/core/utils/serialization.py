@@ -0,0 +1,20 @@
+"""JSON serialization helpers backed by orjson."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize object to compact UTF-8 JSON bytes (UUIDs become strings)."""
+    return orjson.dumps(obj)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Deserialize JSON from str or bytes."""
+    return orjson.loads(data)
+
+
+# Response class for JSON endpoints
+DefaultJSONResponse: type[JSONResponse] = ORJSONResponse
@@ -11,3 +11,12 @@ def str_to_obj(string):
         return s
     except:  # noqa
         return string
+
+
+# Backslash-escape LIKE wildcards (and the escape character itself) in one pass
+_LIKE_ESCAPE = str.maketrans({"\\": "\\\\", "%": r"\%", "_": r"\_"})
+
+
+def escape_like(value: str) -> str:
+    """Escape a user-supplied term for a LIKE/ILIKE pattern using backslash as the escape character."""
+    return value.translate(_LIKE_ESCAPE)
@@ -13,20 +13,29 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Any
 
-import jwt
 from fastapi import WebSocket, WebSocketDisconnect
 from jwt import InvalidTokenError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.config import settings
 from src.core.database import get_db
 from src.core.logging import get_logger
+from src.core.security import security_service
+from src.core.utils.serialization import json_dumps
 from src.modules.users.models import User
 from src.modules.users.repository import UserRepository
 
 logger = get_logger(__name__)
 
 
+async def send_json(websocket: WebSocket, data: dict[str, Any]) -> None:
+    """Send a JSON message as a text frame, encoded with the fast shared codec.
+
+    Starlette's WebSocket.send_json goes through stdlib json.dumps; this keeps the
+    same text-frame protocol while letting orjson produce the UTF-8 payload.
+    """
+    await websocket.send_text(json_dumps(data).decode())
+
+
 # =============================================================================
 # WebSocket Error Codes
 # =============================================================================
@@ -168,7 +177,7 @@ async def authenticate_websocket(token: str, db: AsyncSession) -> User:
         if token.startswith("Bearer "):
             token = token[7:]
 
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = security_service.decode_access_token(token)
         user_id_str = payload.get("sub")
 
         if not user_id_str:
@@ -220,7 +229,7 @@ class BaseWebSocketHandler(ABC):
                     await self._process_chat_message(data)
 
             async def on_connect(self) -> None:
-                await self.send({"type": "connected", "user_id": str(self.user.id)})
+                await self.send({"type": "connected", "user_id": self.user.id})
     """
 
     def __init__(self, websocket: WebSocket, token: str):
@@ -397,7 +406,7 @@ class BaseWebSocketHandler(ABC):
             data: Dictionary to send as JSON
         """
         if self._is_connected:
-            await self.websocket.send_json(data)
+            await send_json(self.websocket, data)
 
     async def send_error(
         self,
@@ -500,7 +509,7 @@ class ConnectionManager:
         """
         if user_id in self.active_connections:
             try:
-                await self.active_connections[user_id].send_json(message)
+                await send_json(self.active_connections[user_id], message)
                 return True
             except Exception:
                 self.disconnect(user_id)
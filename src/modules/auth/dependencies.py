@@ -1,18 +1,84 @@
+import asyncio
+import uuid
 from typing import Any
 
-import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jwt import InvalidTokenError
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
-from src.core.config import settings
 from src.core.database import get_db
+from src.core.logging import get_logger
+from src.core.security import security_service
+from src.core.services.redis_service import RedisService
+from src.core.utils.cache import TTLCache
 from src.modules.users.models import User
 from src.modules.users.repository import UserRepository
 
+logger = get_logger(__name__)
+
 security = HTTPBearer()
 
+# Per-process L1 cache for authenticated users, keyed by user id (JWT "sub").
+# Entries are evicted locally and on every worker via Redis pub/sub when a user changes.
+USER_CACHE_TTL_SECONDS = 60
+USER_CACHE_INVALIDATION_CHANNEL = "auth:user_invalidate"
+USER_CACHE_LISTENER_MIN_BACKOFF_SECONDS = 1.0
+USER_CACHE_LISTENER_MAX_BACKOFF_SECONDS = 30.0
+
+# The cache holds plain column values, never the ORM instance: that one belongs to the request's
+# session and is expired and detached when the session is rolled back or closed.
+_user_cache: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+
+_USER_COLUMNS: tuple[str, ...] = tuple(attr.key for attr in inspect(User).column_attrs)
+
+
+def _snapshot_user(user: User) -> dict[str, Any]:
+    """Copy a freshly loaded user's column values."""
+    return {key: getattr(user, key) for key in _USER_COLUMNS}
+
+
+def _user_from_snapshot(values: dict[str, Any]) -> User:
+    """Build a detached, clean User from cached column values, as if it had just been loaded."""
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+
+async def invalidate_cached_user(user_id: uuid.UUID | str, redis: RedisService) -> None:
+    """Evict a user from the L1 cache in this and all other worker processes."""
+    key = str(user_id)
+    _user_cache.pop(key)
+    try:
+        await redis.publish(USER_CACHE_INVALIDATION_CHANNEL, key)
+    except Exception as e:
+        logger.warning(f"Failed to publish user cache invalidation for {key}: {e}")
+
+
+async def listen_for_user_cache_invalidations(redis: RedisService) -> None:
+    """Evict users from the L1 cache as invalidations are published by other workers.
+
+    Runs for the lifetime of the application (started from the lifespan handler) and
+    resubscribes with exponential backoff whenever the Redis connection drops.
+    """
+    delay = USER_CACHE_LISTENER_MIN_BACKOFF_SECONDS
+    while True:
+        try:
+            async for user_id in redis.listen(USER_CACHE_INVALIDATION_CHANNEL):
+                _user_cache.pop(user_id)
+                delay = USER_CACHE_LISTENER_MIN_BACKOFF_SECONDS
+        except Exception as e:
+            logger.error(f"User cache invalidation listener failed, retrying in {delay:.0f}s: {e}")
+        else:
+            logger.warning(f"User cache invalidation subscription ended, retrying in {delay:.0f}s")
+
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, USER_CACHE_LISTENER_MAX_BACKOFF_SECONDS)
+        # Invalidations published while unsubscribed were missed, so nothing cached until now can be trusted
+        _user_cache.clear()
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(dependency=security),
@@ -30,21 +96,24 @@ async def get_current_user(
     )
 
     try:
-        payload: Any = jwt.decode(
-            jwt=token,
-            key=settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
-        )
+        payload: Any = security_service.decode_access_token(token)
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
 
     except InvalidTokenError:
         raise credentials_exception
-    user_repo = UserRepository(db=db)
-    user: User | None = await user_repo.get(id=user_id)
-    if user is None:
-        raise credentials_exception
+
+    cached: dict[str, Any] | None = _user_cache.get(user_id)
+    if cached is not None:
+        # Attach a session-local copy without re-selecting the row
+        user = await db.merge(_user_from_snapshot(cached), load=False)
+    else:
+        user_repo = UserRepository(db=db)
+        user = await user_repo.get(id=user_id)
+        if user is None:
+            raise credentials_exception
+        _user_cache.set(user_id, _snapshot_user(user))
 
     if not user.is_active:
         raise HTTPException(
@@ -5,6 +5,7 @@ from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
+from src.core.utils.ids import uuid7
 
 
 class RefreshToken(Base):
@@ -12,10 +13,10 @@ class RefreshToken(Base):
 
     __tablename__ = "refresh_tokens"
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
-    user_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
-    )
+    # Time-ordered ids keep inserts on the right edge of the primary key index
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
+    # Indexed through the leading column of ix_refresh_tokens_user_device
+    user_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     token_hash: Mapped[str] = mapped_column(String(64), unique=True, index=True, nullable=False)
 
     device_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -32,6 +33,6 @@ class RefreshToken(Base):
 
     __table_args__ = (
         Index("ix_refresh_tokens_user_device", "user_id", "device_id"),
+        # Range scans for the expired-token cleanup task
         Index("ix_refresh_tokens_expires", "expires_at"),
-        Index("ix_refresh_tokens_revoked", "is_revoked"),
     )
@@ -1,11 +1,14 @@
 import uuid
-from datetime import UTC, datetime, timedelta
+from datetime import timedelta
 
 from sqlalchemy import and_, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.core.repository import BaseRepository
+from src.core.utils.clock import utc_now
 from src.modules.auth.models.refresh_token import RefreshToken
+from src.modules.users.models import User
 
 
 class RefreshTokenRepository(BaseRepository[RefreshToken]):
@@ -33,35 +36,65 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
             device_name=device_name,
             user_agent=user_agent,
             ip_address=ip_address,
-            expires_at=datetime.now(UTC) + expires_delta,
+            expires_at=utc_now() + expires_delta,
             parent_token_id=parent_token_id,
         )
         return await self.create(token)
 
+    async def rotate_token(
+        self,
+        old_token_id: uuid.UUID,
+        user_id: uuid.UUID,
+        token_hash: str,
+        device_id: str | None,
+        device_name: str | None,
+        user_agent: str | None,
+        ip_address: str | None,
+        expires_delta: timedelta,
+    ) -> RefreshToken:
+        """Insert the replacement token and revoke the old one in a single transaction."""
+        token = RefreshToken(
+            user_id=user_id,
+            token_hash=token_hash,
+            device_id=device_id,
+            device_name=device_name,
+            user_agent=user_agent,
+            ip_address=ip_address,
+            expires_at=utc_now() + expires_delta,
+            parent_token_id=old_token_id,
+        )
+        self.db.add(token)
+        await self.db.flush()
+
+        stmt = (
+            update(RefreshToken)
+            .where(RefreshToken.id == old_token_id)
+            .values(is_revoked=True, revoked_at=utc_now(), replaced_by_id=token.id)
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
+        return token
+
     async def get_by_token_hash(self, token_hash: str) -> RefreshToken | None:
         """Get refresh token by hash."""
         stmt = select(RefreshToken).where(RefreshToken.token_hash == token_hash)
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_user_tokens(
-        self,
-        user_id: uuid.UUID,
-        device_id: str | None = None,
-        include_revoked: bool = False,
-    ) -> list[RefreshToken]:
-        """Get all tokens for user, optionally filtered by device."""
-        conditions = [RefreshToken.user_id == user_id]
-
-        if device_id:
-            conditions.append(RefreshToken.device_id == device_id)
-
-        if not include_revoked:
-            conditions.append(RefreshToken.is_revoked == False)  # noqa: E712
-
-        stmt = select(RefreshToken).where(and_(*conditions))
+    async def get_valid_with_user(self, token_hash: str) -> tuple[RefreshToken, User] | None:
+        """Get a non-revoked, unexpired token together with its user in one query."""
+        stmt = (
+            select(RefreshToken, User)
+            .join(User, User.id == RefreshToken.user_id)
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.is_revoked == False,  # noqa: E712
+                RefreshToken.expires_at > utc_now(),
+            )
+        )
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        row = result.one_or_none()
+        return (row[0], row[1]) if row else None
 
     async def revoke_token(self, token_id: uuid.UUID, replaced_by_id: uuid.UUID | None = None) -> bool:
         """Revoke a token (for rotation or logout)."""
@@ -70,7 +103,7 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
             .where(RefreshToken.id == token_id)
             .values(
                 is_revoked=True,
-                revoked_at=datetime.now(UTC),
+                revoked_at=utc_now(),
                 replaced_by_id=replaced_by_id,
             )
         )
@@ -80,42 +113,45 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         return getattr(result, "rowcount", 0) > 0
 
     async def revoke_token_chain(self, token_id: uuid.UUID) -> int:
-        """Revoke entire token chain (for reuse detection)."""
-        token = await self.get(token_id)
-        if not token:
-            return 0
-
-        chain_tokens = []
-        current = token
-
-        while current.parent_token_id:
-            parent = await self.get(current.parent_token_id)
-            if parent:
-                chain_tokens.append(parent.id)
-                current = parent
-            else:
-                break
-
-        if chain_tokens:
-            stmt = (
-                update(RefreshToken)
-                .where(RefreshToken.id.in_(chain_tokens))
-                .values(is_revoked=True, revoked_at=datetime.now(UTC))
-            )
-            result = await self.db.execute(stmt)
-            await self.db.commit()
-            return getattr(result, "rowcount", 0)
+        """Revoke entire token chain (for reuse detection).
+
+        Ancestors are collected with a recursive CTE and revoked by a single
+        UPDATE, so the chain length does not add round-trips.
+        """
+        chain = (
+            select(RefreshToken.id, RefreshToken.parent_token_id)
+            .where(RefreshToken.id == token_id)
+            .cte("token_chain", recursive=True)
+        )
+        parent = aliased(RefreshToken)
+        # UNION (not UNION ALL) stops the recursion even if parent links ever form a cycle
+        chain = chain.union(select(parent.id, parent.parent_token_id).join(chain, parent.id == chain.c.parent_token_id))
+
+        stmt = (
+            update(RefreshToken)
+            .where(RefreshToken.id.in_(select(chain.c.id)), RefreshToken.id != token_id)
+            .values(is_revoked=True, revoked_at=utc_now())
+        )
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        return getattr(result, "rowcount", 0)
+
+    async def revoke_all_user_tokens(self, user_id: uuid.UUID, except_token_hash: str | None = None) -> int:
+        """Revoke all tokens for a user (logout all devices).
 
-        return 0
+        Args:
+            user_id: UUID of the user
+            except_token_hash: Hash of a token to keep active (current device)
 
-    async def revoke_all_user_tokens(self, user_id: uuid.UUID, except_token_id: uuid.UUID | None = None) -> int:
-        """Revoke all tokens for a user (logout all devices)."""
+        Returns:
+            Number of tokens revoked
+        """
         conditions = [RefreshToken.user_id == user_id, RefreshToken.is_revoked == False]  # noqa: E712
 
-        if except_token_id:
-            conditions.append(RefreshToken.id != except_token_id)
+        if except_token_hash:
+            conditions.append(RefreshToken.token_hash != except_token_hash)
 
-        stmt = update(RefreshToken).where(and_(*conditions)).values(is_revoked=True, revoked_at=datetime.now(UTC))
+        stmt = update(RefreshToken).where(and_(*conditions)).values(is_revoked=True, revoked_at=utc_now())
         result = await self.db.execute(stmt)
         await self.db.commit()
         return getattr(result, "rowcount", 0)
@@ -131,27 +167,28 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
                     RefreshToken.is_revoked == False,  # noqa: E712
                 )
             )
-            .values(is_revoked=True, revoked_at=datetime.now(UTC))
+            .values(is_revoked=True, revoked_at=utc_now())
         )
         result = await self.db.execute(stmt)
         await self.db.commit()
         return getattr(result, "rowcount", 0)
 
-    async def cleanup_expired_tokens(self) -> int:
-        """Delete expired tokens (for celery task)."""
-        stmt = delete(RefreshToken).where(RefreshToken.expires_at < datetime.now(UTC))
-        result = await self.db.execute(stmt)
-        await self.db.commit()
-        return getattr(result, "rowcount", 0)
+    async def cleanup_expired_tokens(self, batch_size: int = 5000) -> int:
+        """Delete expired tokens (for celery task).
 
-    async def is_token_valid(self, token_hash: str) -> bool:
-        """Quick validation: exists, not revoked, not expired."""
-        token = await self.get_by_token_hash(token_hash)
+        Deletes in bounded batches driven by the expires_at index so each
+        transaction stays short and avoids long locks on a large table.
+        """
+        now = utc_now()
+        total_deleted = 0
 
-        if not token:
-            return False
-
-        if token.is_revoked:
-            return False
+        while True:
+            expired_ids = select(RefreshToken.id).where(RefreshToken.expires_at < now).limit(batch_size)
+            stmt = delete(RefreshToken).where(RefreshToken.id.in_(expired_ids))
+            result = await self.db.execute(stmt)
+            await self.db.commit()
 
-        return not token.expires_at < datetime.now(UTC)
+            deleted = getattr(result, "rowcount", 0)
+            total_deleted += deleted
+            if deleted < batch_size:
+                return total_deleted
@@ -11,6 +11,7 @@ from src.core.middlewares.ratelimit import (
 )
 from src.core.schema import ErrorResponse
 from src.core.services.redis_service import RedisService, get_redis_service
+from src.core.utils.serialization import DefaultJSONResponse
 from src.modules.auth.dependencies import get_current_user
 from src.modules.auth.schemas import (
     ForgotPasswordRequest,
@@ -32,25 +33,50 @@ from src.modules.auth.schemas import (
 from src.modules.auth.service import AuthService
 from src.modules.users.models import User
 
-router = APIRouter()
+router = APIRouter(default_response_class=DefaultJSONResponse)
+
+# ASGI header names are already lowercased bytes, so raw lookups need no case folding
+CLIENT_INFO_HEADERS: dict[bytes, str] = {
+    b"x-device-id": "device_id",
+    b"x-device-name": "device_name",
+    b"user-agent": "user_agent",
+}
 
 
 def get_client_info(request: Request) -> dict[str, str | None]:
     """Extract device and client information from request headers.
 
+    Scans the raw header list once instead of doing a separate
+    case-insensitive lookup per header.
+
     Args:
         request: FastAPI Request object
 
     Returns:
         Dictionary with device_id, device_name, user_agent, ip_address
     """
-    return {
-        "device_id": request.headers.get("X-Device-ID"),
-        "device_name": request.headers.get("X-Device-Name"),
-        "user_agent": request.headers.get("User-Agent"),
+    client_info: dict[str, str | None] = {
+        "device_id": None,
+        "device_name": None,
+        "user_agent": None,
         "ip_address": request.client.host if request.client else None,
     }
 
+    for name, value in request.headers.raw:
+        field = CLIENT_INFO_HEADERS.get(name)
+        if field is not None and client_info[field] is None:
+            client_info[field] = value.decode("latin-1")
+
+    return client_info
+
+
+def get_auth_service(
+    db: AsyncSession = Depends(get_db),
+    redis: RedisService = Depends(get_redis_service),
+) -> AuthService:
+    """Provide a request-scoped AuthService (resolved once per request by FastAPI)."""
+    return AuthService(db, redis)
+
 
 @router.post(
     path="/register",
@@ -67,10 +93,8 @@ def get_client_info(request: Request) -> dict[str, str | None]:
 )
 async def register(
     request: RegisterRequest,
-    db: AsyncSession = Depends(get_db),
-    redis: RedisService = Depends(get_redis_service),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
-    auth_service = AuthService(db, redis)
     return await auth_service.register_email(register_data=request)
 
 
@@ -89,12 +113,9 @@ async def register(
 )
 async def login(
     request_data: LoginRequest,
-    request: Request,
-    db: AsyncSession = Depends(get_db),
-    redis: RedisService = Depends(get_redis_service),
+    client_info: dict[str, str | None] = Depends(get_client_info),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
-    auth_service = AuthService(db, redis)
-    client_info = get_client_info(request)
     return await auth_service.authenticate_email(login_data=request_data, **client_info)
 
 
@@ -107,12 +128,9 @@ async def login(
 )
 async def google_auth(
     request_data: SocialLoginRequest,
-    request: Request,
-    db: AsyncSession = Depends(get_db),
-    redis: RedisService = Depends(get_redis_service),
+    client_info: dict[str, str | None] = Depends(get_client_info),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
-    auth_service = AuthService(db, redis)
-    client_info = get_client_info(request)
     return await auth_service.authenticate_google(request_data.access_token, **client_info)
 
 
@@ -125,12 +143,9 @@ async def google_auth(
 )
 async def apple_auth(
     request_data: SocialLoginRequest,
-    request: Request,
-    db: AsyncSession = Depends(get_db),
-    redis: RedisService = Depends(get_redis_service),
+    client_info: dict[str, str | None] = Depends(get_client_info),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
-    auth_service = AuthService(db, redis)
-    client_info = get_client_info(request)
     return await auth_service.authenticate_apple(request_data.access_token, **client_info)
 
 
@@ -143,12 +158,9 @@ async def apple_auth(
 )
 async def verify_email(
     request_data: VerifyEmailRequest,
-    request: Request,
-    db: AsyncSession = Depends(get_db),
-    redis: RedisService = Depends(get_redis_service),
+    client_info: dict[str, str | None] = Depends(get_client_info),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
-    auth_service = AuthService(db, redis)
-    client_info = get_client_info(request)
     return await auth_service.verify_email(verify_data=request_data, **client_info)
 
 
@@ -163,10 +175,8 @@ async def verify_email(
 )
 async def resend_code(
     request: ResendCodeRequest,
-    db: AsyncSession = Depends(get_db),
-    redis: RedisService = Depends(get_redis_service),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
-    auth_service = AuthService(db, redis)
     return await auth_service.resend_verification_code(str(request.email))
 
 
@@ -178,10 +188,8 @@ async def resend_code(
 )
 async def reset_password(
     request: ResetPasswordRequest,
-    db: AsyncSession = Depends(get_db),
-    redis: RedisService = Depends(get_redis_service),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
-    auth_service = AuthService(db, redis)
     return await auth_service.reset_password(request)
 
 
@@ -193,10 +201,8 @@ async def reset_password(
 )
 async def verify_reset_code(
     request: VerifyResetCodeRequest,
-    db: AsyncSession = Depends(get_db),
-    redis: RedisService = Depends(get_redis_service),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
-    auth_service = AuthService(db, redis)
     return await auth_service.verify_reset_code(request)
 
 
@@ -209,10 +215,8 @@ async def verify_reset_code(
 )
 async def forgot_password(
     request: ForgotPasswordRequest,
-    db: AsyncSession = Depends(get_db),
-    redis: RedisService = Depends(get_redis_service),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
-    auth_service = AuthService(db, redis)
     return await auth_service.forgot_password(str(request.email))
 
 
@@ -231,12 +235,9 @@ async def forgot_password(
 )
 async def refresh_token(
     request_data: RefreshTokenRequest,
-    request: Request,
-    db: AsyncSession = Depends(get_db),
-    redis: RedisService = Depends(get_redis_service),
+    client_info: dict[str, str | None] = Depends(get_client_info),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
-    auth_service = AuthService(db, redis)
-    client_info = get_client_info(request)
     return await auth_service.refresh_access_token(
         refresh_token=request_data.refresh_token,
         **client_info,
@@ -259,10 +260,8 @@ async def refresh_token(
 async def logout(
     request_data: LogoutRequest,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-    redis: RedisService = Depends(get_redis_service),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
-    auth_service = AuthService(db, redis)
     return await auth_service.logout_device(
         user_id=current_user.id,
         refresh_token=request_data.refresh_token,
@@ -285,10 +284,8 @@ async def logout(
 async def logout_all(
     request_data: LogoutAllRequest,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-    redis: RedisService = Depends(get_redis_service),
+    auth_service: AuthService = Depends(get_auth_service),
 ):
-    auth_service = AuthService(db, redis)
     except_token = request_data.refresh_token if request_data.except_current else None
     return await auth_service.logout_all_devices(
         user_id=current_user.id,
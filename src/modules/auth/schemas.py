@@ -1,9 +1,17 @@
 import re
 import uuid
+from typing import Annotated
 
-from pydantic import EmailStr, Field, field_validator
+from pydantic import EmailStr, Field, StringConstraints, field_validator
 
-from src.core.schema import BaseSchema
+from src.core.schema import BaseSchema, EmailStrFast
+
+_CODE_RE = re.compile(r"^\d{4}$")
+_LETTER_RE = re.compile(r"[A-Za-z]")
+_DIGIT_RE = re.compile(r"\d")
+_SPECIAL_CHAR_RE = re.compile(r"[!@#$%^&*(),.?\":{}|<>]")
+
+VerificationCode = Annotated[str, StringConstraints(min_length=4, max_length=4, pattern=_CODE_RE)]
 
 
 class SocialLoginRequest(BaseSchema):
@@ -11,7 +19,7 @@ class SocialLoginRequest(BaseSchema):
 
 
 class LoginRequest(BaseSchema):
-    email: EmailStr
+    email: EmailStrFast
     password: str
 
 
@@ -26,35 +34,29 @@ class RegisterRequest(BaseSchema):
 
     @field_validator("password")
     def validate_password_strength(cls, v):
-        if not re.search(r"[A-Za-z]", v) or not re.search(r"\d", v):
+        if not _LETTER_RE.search(v) or not _DIGIT_RE.search(v):
             raise ValueError("Password must contain both letters and numbers")
-        if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", v):
+        if not _SPECIAL_CHAR_RE.search(v):
             raise ValueError("Password must contain at least one special character")
         return v
 
 
 class ForgotPasswordRequest(BaseSchema):
-    email: EmailStr
+    email: EmailStrFast
 
 
 class ResendCodeRequest(BaseSchema):
-    email: EmailStr
+    email: EmailStrFast
 
 
 class VerifyEmailRequest(BaseSchema):
-    email: EmailStr
-    code: str = Field(
-        ...,
-        min_length=4,
-        max_length=4,
-        pattern=r"^\d{4}$",
-        description="4-digit verification code",
-    )
+    email: EmailStrFast
+    code: VerificationCode = Field(..., description="4-digit verification code")
 
 
 class VerifyResetCodeRequest(BaseSchema):
-    email: EmailStr
-    code: str = Field(..., min_length=4, max_length=4, pattern=r"^\d{4}$")
+    email: EmailStrFast
+    code: VerificationCode
 
 
 class ResetPasswordRequest(BaseSchema):
@@ -63,9 +65,9 @@ class ResetPasswordRequest(BaseSchema):
 
     @field_validator("new_password")
     def validate_new_password_strength(cls, v):
-        if not re.search(r"[A-Za-z]", v) or not re.search(r"\d", v):
+        if not _LETTER_RE.search(v) or not _DIGIT_RE.search(v):
             raise ValueError("Password must contain both letters and numbers")
-        if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", v):
+        if not _SPECIAL_CHAR_RE.search(v):
             raise ValueError("Password must contain at least one special character")
         return v
 
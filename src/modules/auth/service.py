@@ -1,9 +1,10 @@
+import asyncio
 import uuid
-from datetime import UTC, datetime, timedelta
+from datetime import timedelta
 from logging import Logger
 
-import httpx
 import jwt
+from fastapi.concurrency import run_in_threadpool
 from google.auth.transport import requests as google_requests
 from google.oauth2 import id_token
 from jwt import PyJWKClient
@@ -14,16 +15,32 @@ from src.core.enums import AuthProviderEnum
 from src.core.exception import AuthenticationError, AuthorizationError, BusinessRuleError, NotFoundError
 from src.core.logging import get_logger
 from src.core.security import security_service
-from src.core.services.email_service import email_service
 from src.core.services.redis_service import RedisService
+from src.modules.auth.dependencies import invalidate_cached_user
+from src.modules.auth.models.refresh_token import RefreshToken
 from src.modules.auth.repositories.refresh_token_repo import RefreshTokenRepository
 from src.modules.auth.schemas import ResetPasswordRequest, VerifyResetCodeRequest
+from src.modules.auth.tasks.email_tasks import send_reset_password_code_email, send_verification_code_email
 from src.modules.users.models import User
 from src.modules.users.repository import UserRepository
 from src.utils.helpers import generate_verification_code
 
 logger: Logger = get_logger(name=__name__)
 
+REFRESH_TOKEN_TTL = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+CODE_TTL = timedelta(minutes=15)
+CODE_RETRY_TTL = timedelta(minutes=10)
+RESEND_COOLDOWN = timedelta(minutes=2)
+RESET_TOKEN_TTL = timedelta(minutes=10)
+MAX_CODE_ATTEMPTS = 3
+
+APPLE_KEYS_URL = "https://appleid.apple.com/auth/keys"
+
+# Shared across requests: the Apple JWKS is cached (and refetched on an unknown kid),
+# and the Google transport reuses its HTTP connection pool for certificate fetches.
+_apple_jwk_client = PyJWKClient(APPLE_KEYS_URL, cache_keys=True, lifespan=3600)
+_google_request = google_requests.Request()
+
 
 class AuthService:
     def __init__(self, db: AsyncSession, redis: RedisService):
@@ -52,6 +69,37 @@ class AuthService:
         Returns:
             Dictionary with access_token, refresh_token, token_type, and is_new_user
         """
+        tokens, _ = await self._issue_token_pair(
+            user=user,
+            device_id=device_id,
+            device_name=device_name,
+            user_agent=user_agent,
+            ip_address=ip_address,
+        )
+        return tokens
+
+    async def _issue_token_pair(
+        self,
+        user: User,
+        device_id: str | None = None,
+        device_name: str | None = None,
+        user_agent: str | None = None,
+        ip_address: str | None = None,
+        parent_token_id: uuid.UUID | None = None,
+    ) -> tuple[dict, RefreshToken]:
+        """Create a token pair and return it together with the stored refresh token row.
+
+        Args:
+            user: User object
+            device_id: Unique device identifier from client
+            device_name: Human-readable device name
+            user_agent: User agent string from request
+            ip_address: Client IP address
+            parent_token_id: Id of the token being rotated; it is revoked in the same transaction
+
+        Returns:
+            Tuple of (token dictionary, created RefreshToken)
+        """
         # Create access token (1 hour)
         access_token = security_service.create_access_token(subject=user.id)
 
@@ -59,36 +107,37 @@ class AuthService:
         refresh_token = security_service.create_refresh_token()
         token_hash = security_service.hash_token(refresh_token)
 
-        # Calculate expiration
-        expires_delta = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-        expires_at = datetime.now(UTC) + expires_delta
-
-        # Save to database
-        await self.refresh_token_repo.create_token(
-            user_id=user.id,
-            token_hash=token_hash,
-            expires_delta=expires_delta,
-            device_id=device_id,
-            device_name=device_name,
-            user_agent=user_agent,
-            ip_address=ip_address,
-        )
-
-        # Cache in Redis
-        await self.redis.cache_refresh_token(
-            token_hash=token_hash,
-            user_id=str(user.id),
-            expires_at=expires_at,
-            device_id=device_id,
-        )
+        if parent_token_id:
+            # Rotation: insert the replacement and revoke its parent in one transaction
+            db_token = await self.refresh_token_repo.rotate_token(
+                old_token_id=parent_token_id,
+                user_id=user.id,
+                token_hash=token_hash,
+                expires_delta=REFRESH_TOKEN_TTL,
+                device_id=device_id,
+                device_name=device_name,
+                user_agent=user_agent,
+                ip_address=ip_address,
+            )
+        else:
+            db_token = await self.refresh_token_repo.create_token(
+                user_id=user.id,
+                token_hash=token_hash,
+                expires_delta=REFRESH_TOKEN_TTL,
+                device_id=device_id,
+                device_name=device_name,
+                user_agent=user_agent,
+                ip_address=ip_address,
+            )
 
         logger.info(f"Created token pair for user {user.id}, device: {device_id}")
 
-        return {
+        tokens = {
             "access_token": access_token,
             "refresh_token": refresh_token,
             "token_type": "bearer",
         }
+        return tokens, db_token
 
     async def refresh_access_token(
         self,
@@ -116,76 +165,56 @@ class AuthService:
         Raises:
             AuthenticationError: If token is invalid, expired, or revoked
         """
+        if not security_service.is_refresh_token_format(refresh_token):
+            raise AuthenticationError("Invalid refresh token.")
+
         # Hash the incoming token
         token_hash = security_service.hash_token(refresh_token)
 
-        # Check cache first (fast path)
-        cached_token = await self.redis.get_cached_token(token_hash)
-        if cached_token:
-            # Token exists in cache, check if it's valid
-            is_valid = await self.refresh_token_repo.is_token_valid(token_hash)
-            if not is_valid:
-                # Token was revoked - check if it's being reused
-                db_token = await self.refresh_token_repo.get_by_token_hash(token_hash)
-                if db_token and db_token.is_revoked:
-                    # CRITICAL: Reuse detection - revoke entire chain
-                    await self.refresh_token_repo.revoke_token_chain(db_token.id)
-                    await self.redis.invalidate_token_cache(token_hash)
-                    logger.warning(
-                        f"Refresh token reuse detected for user {db_token.user_id}, "
-                        f"device: {device_id}. Revoking entire chain."
-                    )
-                    raise AuthenticationError("Token has been revoked. Please log in again.")
-
-                raise AuthenticationError("Invalid or expired refresh token.")
-        else:
-            # Not in cache, validate from database
-            is_valid = await self.refresh_token_repo.is_token_valid(token_hash)
-            if not is_valid:
-                db_token = await self.refresh_token_repo.get_by_token_hash(token_hash)
-                if db_token and db_token.is_revoked:
-                    # CRITICAL: Reuse detection - revoke entire chain
-                    await self.refresh_token_repo.revoke_token_chain(db_token.id)
-                    logger.warning(
-                        f"Refresh token reuse detected for user {db_token.user_id}, "
-                        f"device: {device_id}. Revoking entire chain."
-                    )
-                    raise AuthenticationError("Token has been revoked. Please log in again.")
-
-                raise AuthenticationError("Invalid or expired refresh token.")
-
-        # Get the token from database
-        db_token = await self.refresh_token_repo.get_by_token_hash(token_hash)
-        if not db_token:
-            raise AuthenticationError("Invalid refresh token.")
+        # The Redis used-marker and the indexed token+user lookup are independent round-trips
+        used_token_id, valid = await asyncio.gather(
+            self.redis.get_used_token_id(token_hash),
+            self.refresh_token_repo.get_valid_with_user(token_hash),
+        )
+
+        # Rotated tokens are marked in Redis, so reuse is detected without inspecting the row
+        if used_token_id:
+            # CRITICAL: Reuse detection - revoke entire chain
+            await self.refresh_token_repo.revoke_token_chain(uuid.UUID(used_token_id))
+            logger.warning(
+                f"Refresh token reuse detected for token {used_token_id}, device: {device_id}. Revoking entire chain."
+            )
+            raise AuthenticationError("Token has been revoked. Please log in again.")
 
-        # Get user
-        user = await self.user_repo.get(db_token.user_id)
-        if not user or not user.is_active:
+        if valid is None:
+            # Unknown, expired or revoked - only now load the row to check for reuse
+            db_token = await self.refresh_token_repo.get_by_token_hash(token_hash)
+            if db_token and db_token.is_revoked:
+                # CRITICAL: Reuse detection - revoke entire chain
+                await self.refresh_token_repo.revoke_token_chain(db_token.id)
+                logger.warning(
+                    f"Refresh token reuse detected for user {db_token.user_id}, "
+                    f"device: {device_id}. Revoking entire chain."
+                )
+                raise AuthenticationError("Token has been revoked. Please log in again.")
+
+            raise AuthenticationError("Invalid or expired refresh token.")
+
+        db_token, user = valid
+        if not user.is_active:
             raise AuthenticationError("User not found or inactive.")
 
-        # Create new token pair
-        new_tokens = await self._create_token_pair(
+        # Create new token pair; the old token is revoked in the same transaction
+        new_tokens, _ = await self._issue_token_pair(
             user=user,
             device_id=device_id or db_token.device_id,
             device_name=device_name or db_token.device_name,
             user_agent=user_agent,
             ip_address=ip_address,
+            parent_token_id=db_token.id,
         )
 
-        # Get the new token from database to link parent
-        new_token_hash = security_service.hash_token(new_tokens["refresh_token"])
-        new_db_token = await self.refresh_token_repo.get_by_token_hash(new_token_hash)
-
-        if new_db_token:
-            # Link parent for chain tracking
-            await self.refresh_token_repo.update(new_db_token, {"parent_token_id": db_token.id})
-
-        # Revoke old token (rotation)
-        await self.refresh_token_repo.revoke_token(
-            db_token.id, replaced_by_id=new_db_token.id if new_db_token else None
-        )
-        await self.redis.invalidate_token_cache(token_hash)
+        await self.redis.mark_token_used(token_hash, str(db_token.id), db_token.expires_at)
 
         logger.info(f"Refreshed token for user {user.id}, device: {device_id}")
 
@@ -209,6 +238,9 @@ class AuthService:
             NotFoundError: If token not found
             AuthorizationError: If token doesn't belong to user
         """
+        if not security_service.is_refresh_token_format(refresh_token):
+            raise NotFoundError("Token not found.")
+
         token_hash = security_service.hash_token(refresh_token)
         db_token = await self.refresh_token_repo.get_by_token_hash(token_hash)
 
@@ -220,7 +252,6 @@ class AuthService:
 
         # Revoke the token
         await self.refresh_token_repo.revoke_token(db_token.id)
-        await self.redis.invalidate_token_cache(token_hash)
 
         logger.info(f"User {user_id} logged out from device: {db_token.device_id}")
 
@@ -236,64 +267,53 @@ class AuthService:
         Returns:
             Dictionary with success message and count of revoked tokens
         """
-        except_token_id = None
-        if except_token:
-            token_hash = security_service.hash_token(except_token)
-            db_token = await self.refresh_token_repo.get_by_token_hash(token_hash)
-            if db_token and db_token.user_id == user_id:
-                except_token_id = db_token.id
+        except_token_hash = security_service.hash_token(except_token) if except_token else None
 
-        # Revoke all user tokens
+        # Revoke all user tokens in a single UPDATE (no token list is fetched)
         revoked_count = await self.refresh_token_repo.revoke_all_user_tokens(
-            user_id=user_id, except_token_id=except_token_id
+            user_id=user_id, except_token_hash=except_token_hash
         )
 
-        # Note: Redis cache will be invalidated by the repository method
-        # or will naturally expire
-
         logger.info(f"User {user_id} logged out from all devices. Revoked {revoked_count} tokens.")
 
         return {"message": f"Successfully logged out from all devices. Revoked {revoked_count} sessions."}
 
+    @staticmethod
+    def _code_keys(email: str, type_prefix: str) -> tuple[str, str]:
+        """Redis keys for a one-time code and its failed-attempt counter."""
+        return f"{type_prefix}:{email}", f"{type_prefix}_attempts:{email}"
+
     async def _generate_and_save_code(self, email: str, type_prefix) -> str:
         """Generate and save verification code in Redis"""
         code = generate_verification_code()
 
-        code_key = f"{type_prefix}:{email}"
-        attempt_key = f"{type_prefix}_attempts:{email}"
-        await self.redis.set(code_key, code, timedelta(minutes=15))
-        await self.redis.set(attempt_key, 0, timedelta(minutes=15))
+        code_key, attempt_key = self._code_keys(email, type_prefix)
+        await self.redis.set_many({code_key: code, attempt_key: 0}, CODE_TTL)
 
         return code
 
     async def _validate_code(self, email: str, input_code: str, type_prefix: str):
         """Validate verification code against Redis"""
-        code_key = f"{type_prefix}:{email}"
-        attempt_key = f"{type_prefix}_attempts:{email}"
+        code_key, attempt_key = self._code_keys(email, type_prefix)
 
-        stored_code = await self.redis.get(code_key)
+        attempts = await self.redis.check_code(
+            code_key, attempt_key, input_code, expire=CODE_RETRY_TTL, max_attempts=MAX_CODE_ATTEMPTS
+        )
 
-        if not stored_code:
+        if attempts < 0:
             raise BusinessRuleError("Code invalid or expired.")
 
-        if stored_code != input_code:
-            attempts: int = await self.redis.increment(attempt_key)
-
-            if attempts == 1:
-                await self.redis.expire(code_key, timedelta(minutes=10))
-
-            if attempts >= 3:
-                await self.redis.delete(code_key, attempt_key)
-                raise BusinessRuleError(
-                    "Too many incorrect entries. Request a new code.",
-                )
+        if attempts >= MAX_CODE_ATTEMPTS:
+            raise BusinessRuleError(
+                "Too many incorrect entries. Request a new code.",
+            )
 
-            remaining = 3 - attempts
+        if attempts > 0:
+            remaining = MAX_CODE_ATTEMPTS - attempts
             raise BusinessRuleError(
                 f"Invalid code. Remaining attempts:{remaining}",
             )
 
-        await self.redis.delete(code_key, attempt_key)
         return True
 
     async def verify_email(
@@ -312,6 +332,8 @@ class AuthService:
         await self._validate_code(verify_data.email, input_code=verify_data.code, type_prefix="verify")
 
         await self.user_repo.update(user, {"is_verified": True})
+        # Evict only once the UPDATE has committed, or another worker could re-cache the old row
+        await invalidate_cached_user(user.id, self.redis)
 
         return await self._create_token_pair(
             user=user,
@@ -330,19 +352,17 @@ class AuthService:
         if user.is_verified:
             return {"message": "If your account is unverified, a code has been sent."}
 
+        # SET NX claims the resend slot in one round-trip, so concurrent requests cannot both pass
         spam_key = f"resend_limit:{email}"
-        is_spaming = await self.redis.get(spam_key)
-
-        if is_spaming:
+        if not await self.redis.set_if_absent(spam_key, 1, expire=RESEND_COOLDOWN):
             raise BusinessRuleError(
                 "Please wait 2 minutes before sending another code.",
             )
 
         code: str = await self._generate_and_save_code(email, type_prefix="verify")
 
-        await self.redis.set(spam_key, 1, expire=timedelta(minutes=2))
-
-        await email_service.send_verification_code(email, code, name="Runner")
+        # The code is already stored; delivery happens on a Celery worker, off the request path
+        await run_in_threadpool(send_verification_code_email.delay, email, code, "Runner")
 
         response = {"message": "Verification code sent to your email."}
 
@@ -358,7 +378,7 @@ class AuthService:
         code = None
         if user:
             code = await self._generate_and_save_code(email, type_prefix="reset")
-            await email_service.send_reset_password_code(email=email, code=code, name=user.full_name or "Runner")
+            await run_in_threadpool(send_reset_password_code_email.delay, email, code, user.full_name or "Runner")
 
         response: dict[str, str] = {"message": "Verification code sent to your email"}
 
@@ -377,14 +397,17 @@ class AuthService:
         await self._validate_code(email=verify_data.email, input_code=verify_data.code, type_prefix="reset")
 
         reset_token = security_service.create_access_token(
-            subject=user.id, extra_data={"scope": "password_reset"}, expires_delta=timedelta(minutes=10)
+            subject=user.id, extra_data={"scope": "password_reset"}, expires_delta=RESET_TOKEN_TTL
         )
 
         return {"reset_token": reset_token, "token_type": "bearer"}
 
     async def reset_password(self, reset_data: ResetPasswordRequest):
+        if not security_service.is_jwt_format(reset_data.reset_token):
+            raise AuthenticationError("Invalid or expired reset token.")
+
         try:
-            payload = jwt.decode(reset_data.reset_token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            payload = security_service.decode_token(reset_data.reset_token)
 
             if payload.get("scope") != "password_reset":
                 raise AuthenticationError("Invalid token scope")
@@ -400,6 +423,8 @@ class AuthService:
 
         new_hashed_password = security_service.get_password_hash(reset_data.new_password)
         await self.user_repo.update(user, {"hashed_password": new_hashed_password})
+        # Evict only once the UPDATE has committed, or another worker could re-cache the old row
+        await invalidate_cached_user(user.id, self.redis)
 
         return {"message": "Your password has been changed successfully."}
 
@@ -423,10 +448,8 @@ class AuthService:
 
         code: str = await self._generate_and_save_code(register_data.email, type_prefix="verify")
 
-        await email_service.send_verification_code(
-            email=register_data.email,
-            code=code,
-            name=register_data.full_name or "Runner",
+        await run_in_threadpool(
+            send_verification_code_email.delay, register_data.email, code, register_data.full_name or "Runner"
         )
 
         response = {"message": "Verification code sent to your email."}
@@ -450,13 +473,14 @@ class AuthService:
 
         error_message = "Invalid email or password."
         user = await self.user_repo.get_by_email(login_data.email)
-        if not user:
-            raise AuthenticationError(error_message)
 
         if not user or not user.hashed_password:
+            # Unknown email or social-only account: still pay one bcrypt check so timing does not reveal it
+            await run_in_threadpool(security_service.verify_dummy_password, login_data.password)
             raise AuthenticationError(error_message)
 
-        if not security_service.verify_password(login_data.password, user.hashed_password):
+        # bcrypt is CPU-bound (~100ms+), keep it off the event loop
+        if not await run_in_threadpool(security_service.verify_password, login_data.password, user.hashed_password):
             raise AuthenticationError(error_message)
 
         if not user.is_verified:
@@ -487,7 +511,9 @@ class AuthService:
     ):
         """Authenticate user using Google OAuth2 token"""
         try:
-            id_info = id_token.verify_oauth2_token(token, google_requests.Request(), settings.GOOGLE_CLIENT_ID)
+            id_info = await run_in_threadpool(
+                id_token.verify_oauth2_token, token, _google_request, settings.GOOGLE_CLIENT_ID
+            )
 
             email = id_info.get("email")
             social_id = id_info.get("sub")
@@ -501,25 +527,21 @@ class AuthService:
 
         user = await self.user_repo.get_by_email(email)
 
-        if not user:
-            new_user = User(
+        if not user or not user.social_id:
+            # Create or link in a single INSERT ... ON CONFLICT (email) DO UPDATE
+            linked = await self.user_repo.upsert_social(
                 email=email,
                 social_id=social_id,
+                provider=AuthProviderEnum.GOOGLE,
                 full_name=name,
                 profile_image=picture,
-                provider=AuthProviderEnum.GOOGLE,
-                is_active=True,
             )
-            user = await self.user_repo.create(new_user)
-        else:
-            if not user.social_id:
-                await self.user_repo.update(
-                    user,
-                    {
-                        "social_id": social_id,
-                        "provider": AuthProviderEnum.GOOGLE,
-                    },
-                )
+            if user:
+                await invalidate_cached_user(user.id, self.redis)
+            # None only if another request linked this email first
+            user = linked or await self.user_repo.get_by_email(email)
+            if not user:
+                raise AuthenticationError("Unable to sign in with Google. Please try again.")
 
         return await self._create_token_pair(
             user=user,
@@ -539,20 +561,8 @@ class AuthService:
     ):
         """Authenticate user using Apple Sign-In token"""
         try:
-            apple_keys_url = "https://appleid.apple.com/auth/keys"
-            async with httpx.AsyncClient() as client:
-                response = await client.get(apple_keys_url)
-            keys = response.json().get("keys")
-
-            header = jwt.get_unverified_header(token)
-            kid = header.get("kid")
-
-            key_data = next((key for key in keys if key["kid"] == kid), None)
-            if not key_data:
-                raise AuthenticationError("Invalid Apple token: key not found.")
-
-            jwk_client = PyJWKClient(apple_keys_url)
-            signing_key = jwk_client.get_signing_key_from_jwt(token)
+            # Blocking only on a JWKS cache miss, so keep it off the event loop
+            signing_key = await run_in_threadpool(_apple_jwk_client.get_signing_key_from_jwt, token)
 
             payload = jwt.decode(
                 token,
@@ -578,23 +588,14 @@ class AuthService:
         user = await self.user_repo.get_by_social_id(social_id=social_id, provider=AuthProviderEnum.APPLE)
 
         if not user:
-            new_user = User(
-                email=email,
-                social_id=social_id,
-                provider=AuthProviderEnum.APPLE,
-                is_active=True,
-                profile_image=None,
-            )
-            user = await self.user_repo.create(new_user)
-        else:
-            if not user.social_id:
-                await self.user_repo.update(
-                    user,
-                    {
-                        "social_id": social_id,
-                        "provider": AuthProviderEnum.APPLE,
-                    },
-                )
+            # Apple only needs to share the email for a new account; later sign-ins match on the subject
+            if not email:
+                raise AuthenticationError("Invalid Apple token: missing email.")
+            # Create, or link an unlinked account with the same email, in a single statement
+            user = await self.user_repo.upsert_social(email=email, social_id=social_id, provider=AuthProviderEnum.APPLE)
+            if not user:
+                raise AuthenticationError("This email is already linked to another account.")
+            await invalidate_cached_user(user.id, self.redis)
 
         return await self._create_token_pair(
             user=user,
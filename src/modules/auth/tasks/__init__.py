@@ -1,3 +1,4 @@
 from src.modules.auth.tasks.cleanup_tasks import cleanup_expired_refresh_tokens
+from src.modules.auth.tasks.email_tasks import send_reset_password_code_email, send_verification_code_email
 
-__all__ = ["cleanup_expired_refresh_tokens"]
+__all__ = ["cleanup_expired_refresh_tokens", "send_reset_password_code_email", "send_verification_code_email"]
@@ -0,0 +1,50 @@
+"""Celery tasks for sending auth emails outside the request cycle."""
+
+from src.core.celery import celery_app, run_async
+from src.core.logging import get_logger
+from src.core.services.email_service import EmailService
+
+logger = get_logger(__name__)
+
+
+async def _send_with_fresh_client(method: str, **kwargs) -> None:
+    # Each task runs in its own event loop, so the HTTP client must not outlive it
+    service = EmailService()
+    try:
+        await getattr(service, method)(**kwargs)
+    finally:
+        await service.close()
+
+
+@celery_app.task(name="email.send_verification_code")
+def send_verification_code_email(email: str, code: str, name: str) -> dict[str, str]:
+    """Send an email verification code.
+
+    Args:
+        email: Recipient email address
+        code: Verification code
+        name: Recipient display name
+
+    Returns:
+        Dictionary with status
+    """
+    run_async(_send_with_fresh_client("send_verification_code", email=email, code=code, name=name))
+    logger.info(f"Verification code email dispatched to {email}")
+    return {"status": "sent"}
+
+
+@celery_app.task(name="email.send_reset_password_code")
+def send_reset_password_code_email(email: str, code: str, name: str) -> dict[str, str]:
+    """Send a password reset code.
+
+    Args:
+        email: Recipient email address
+        code: Reset code
+        name: Recipient display name
+
+    Returns:
+        Dictionary with status
+    """
+    run_async(_send_with_fresh_client("send_reset_password_code", email=email, code=code, name=name))
+    logger.info(f"Reset password email dispatched to {email}")
+    return {"status": "sent"}
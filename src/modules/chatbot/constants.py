@@ -13,6 +13,7 @@ USAGE:
     name = AI_CONFIG["name"]
 """
 
+from functools import lru_cache
 from typing import TypedDict
 
 # =============================================================================
@@ -192,6 +193,15 @@ def _format_list(items: list[str], prefix: str = "- ") -> str:
     return "\n".join(f"{prefix}{item}" for item in items)
 
 
+# Sections derived from the constants above, formatted once at import
+_TOPICS_SECTION = "YOU CAN HELP WITH:\n" + _format_list(ALLOWED_TOPICS) if ALLOWED_TOPICS else ""
+_IDENTITY_SECTION = f"You are {AI_CONFIG['name']}, a {AI_CONFIG['role']}."
+_PERSONALITY_SECTION = "PERSONALITY:\n" + _format_list(PERSONALITY_TRAITS) if PERSONALITY_TRAITS else ""
+_TASKS_SECTION = "TASKS:\n" + "\n".join(f"{i}. {task}" for i, task in enumerate(AI_TASKS, 1)) if AI_TASKS else ""
+_GUIDELINES_SECTION = "GUIDELINES:\n" + _format_list(RESPONSE_GUIDELINES) if RESPONSE_GUIDELINES else ""
+_CUSTOM_CONTEXT_STRIPPED = CUSTOM_CONTEXT.strip()
+
+
 def build_system_prompt(
     include_safety: bool = True,
     include_topics: bool = True,
@@ -231,6 +241,33 @@ def build_system_prompt(
             additional_context="User is a premium subscriber"
         )
     """
+    base = _build_base_prompt(
+        include_safety,
+        include_topics,
+        include_personality,
+        include_tasks,
+        include_guidelines,
+    )
+
+    # Additional context passed as parameter
+    if additional_context:
+        return "\n\n".join((base, additional_context))
+    return base
+
+
+@lru_cache(maxsize=32)
+def _build_base_prompt(
+    include_safety: bool,
+    include_topics: bool,
+    include_personality: bool,
+    include_tasks: bool,
+    include_guidelines: bool,
+) -> str:
+    """Assemble the prompt sections selected by the flags.
+
+    The inputs are module constants plus five booleans, so every combination is
+    built once and then served from the cache.
+    """
     sections: list[str] = []
 
     # Safety rules (always recommended)
@@ -241,43 +278,36 @@ def build_system_prompt(
     sections.append(AI_CONFIG["language_instruction"])
 
     # Allowed topics
-    if include_topics and ALLOWED_TOPICS:
-        topics_section = "YOU CAN HELP WITH:\n" + _format_list(ALLOWED_TOPICS)
-        sections.append(topics_section)
+    if include_topics and _TOPICS_SECTION:
+        sections.append(_TOPICS_SECTION)
 
     # Identity section
     sections.append("---")
-    sections.append(f"You are {AI_CONFIG['name']}, a {AI_CONFIG['role']}.")
+    sections.append(_IDENTITY_SECTION)
 
     # Personality
-    if include_personality and PERSONALITY_TRAITS:
-        personality_section = "PERSONALITY:\n" + _format_list(PERSONALITY_TRAITS)
-        sections.append(personality_section)
+    if include_personality and _PERSONALITY_SECTION:
+        sections.append(_PERSONALITY_SECTION)
 
     # Tasks
-    if include_tasks and AI_TASKS:
-        tasks_section = "TASKS:\n" + _format_list(AI_TASKS, prefix="")
-        for i, task in enumerate(AI_TASKS, 1):
-            tasks_section = tasks_section.replace(f"- {task}", f"{i}. {task}", 1)
-        tasks_section = "TASKS:\n" + "\n".join(f"{i}. {task}" for i, task in enumerate(AI_TASKS, 1))
-        sections.append(tasks_section)
+    if include_tasks and _TASKS_SECTION:
+        sections.append(_TASKS_SECTION)
 
     # Guidelines
-    if include_guidelines and RESPONSE_GUIDELINES:
-        guidelines_section = "GUIDELINES:\n" + _format_list(RESPONSE_GUIDELINES)
-        sections.append(guidelines_section)
+    if include_guidelines and _GUIDELINES_SECTION:
+        sections.append(_GUIDELINES_SECTION)
 
     # Custom context
-    if CUSTOM_CONTEXT.strip():
-        sections.append(CUSTOM_CONTEXT.strip())
-
-    # Additional context passed as parameter
-    if additional_context:
-        sections.append(additional_context)
+    if _CUSTOM_CONTEXT_STRIPPED:
+        sections.append(_CUSTOM_CONTEXT_STRIPPED)
 
     return "\n\n".join(sections)
 
 
+# Build the default prompt at import so the first chat turn doesn't pay for it
+build_system_prompt()
+
+
 # =============================================================================
 # QUICK ACCESS FUNCTIONS
 # =============================================================================
@@ -9,6 +9,7 @@ class MessageRole(str, PyEnum):
 
 class ProcessingStatus(str, PyEnum):
     PENDING = "pending"
+    ATTACHED = "attached"
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
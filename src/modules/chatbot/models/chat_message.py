@@ -1,8 +1,7 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, String, Text, Uuid
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Enum, ForeignKey, Index, Integer, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
@@ -17,15 +16,18 @@ class ChatMessage(Base):
     __tablename__ = "chat_messages"
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # Indexed through the leading column of ix_messages_thread_created
     thread_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("chat_threads.id", ondelete="CASCADE"), nullable=False, index=True
+        Uuid, ForeignKey("chat_threads.id", ondelete="CASCADE"), nullable=False
     )
 
-    role: Mapped[MessageRole] = mapped_column(String(length=20), nullable=False, index=True)
+    role: Mapped[MessageRole] = mapped_column(
+        Enum(MessageRole, name="message_role_enum", values_callable=lambda e: [m.value for m in e]),
+        nullable=False,
+        index=True,
+    )
     content: Mapped[str] = mapped_column(Text, nullable=False)
 
-    attachments: Mapped[list[dict] | None] = mapped_column(JSONB, nullable=True)
-
     tokens_used: Mapped[int | None] = mapped_column(Integer, nullable=True)
     model_used: Mapped[str | None] = mapped_column(String(length=100), nullable=True)
     response_time_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -34,3 +36,15 @@ class ChatMessage(Base):
     media: Mapped[list["MediaUpload"]] = relationship(
         "MediaUpload", back_populates="message", cascade="all, delete-orphan"
     )
+
+    __table_args__ = (
+        # Thread history and latest-message lookups ordered by created_at
+        Index("ix_messages_thread_created", "thread_id", "created_at"),
+        # Trigram index for substring search (requires the pg_trgm extension)
+        Index(
+            "ix_chat_messages_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+    )
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import ForeignKey, Integer, String, Text, Uuid
+from sqlalchemy import ForeignKey, Index, Integer, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
@@ -10,8 +10,9 @@ class ChatSummary(Base):
     __tablename__ = "chat_summaries"
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    # Indexed through the leading column of ix_summaries_thread_created
     thread_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("chat_threads.id", ondelete="CASCADE"), nullable=False, index=True
+        Uuid, ForeignKey("chat_threads.id", ondelete="CASCADE"), nullable=False
     )
 
     message_start_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
@@ -23,4 +24,4 @@ class ChatSummary(Base):
     model_used: Mapped[str] = mapped_column(String(length=100), nullable=False, default="gemini-3-flash-preview")
     tokens_used: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
-    __table_args__ = ()
+    __table_args__ = (Index("ix_summaries_thread_created", "thread_id", "created_at"),)
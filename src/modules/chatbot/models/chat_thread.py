@@ -1,7 +1,7 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String, Uuid
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
@@ -14,9 +14,8 @@ class ChatThread(Base):
     __tablename__ = "chat_threads"
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
-    user_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
-    )
+    # Indexed through the leading column of ix_threads_user_updated
+    user_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     title: Mapped[str | None] = mapped_column(String(length=255), nullable=True)
 
@@ -31,3 +30,15 @@ class ChatThread(Base):
         lazy="selectin",
         order_by="ChatMessage.created_at",
     )
+
+    __table_args__ = (
+        # Per-user listing ordered by most recent activity
+        Index("ix_threads_user_updated", "user_id", "updated_at"),
+        # Trigram index for substring search (requires the pg_trgm extension)
+        Index(
+            "ix_chat_threads_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
@@ -1,11 +1,12 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, String, Text, Uuid
+from sqlalchemy import Enum, ForeignKey, Index, Integer, String, Text, Uuid, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
+from src.modules.chatbot.enums import ProcessingStatus
 
 if TYPE_CHECKING:
     from src.modules.chatbot.models.chat_message import ChatMessage
@@ -15,9 +16,8 @@ class MediaUpload(Base):
     __tablename__ = "media_uploads"
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
-    user_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
-    )
+    # Indexed through the leading column of ix_media_user_created
+    user_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     message_id: Mapped[uuid.UUID | None] = mapped_column(
         Uuid, ForeignKey("chat_messages.id", ondelete="CASCADE"), nullable=True, index=True
     )
@@ -27,7 +27,12 @@ class MediaUpload(Base):
     mime_type: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     file_size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
 
-    processing_status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False, index=True)
+    processing_status: Mapped[ProcessingStatus] = mapped_column(
+        Enum(ProcessingStatus, name="processing_status_enum", values_callable=lambda e: [m.value for m in e]),
+        default=ProcessingStatus.PENDING,
+        nullable=False,
+        index=True,
+    )
 
     extracted_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     extracted_data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
@@ -35,3 +40,14 @@ class MediaUpload(Base):
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     message: Mapped["ChatMessage"] = relationship("ChatMessage", back_populates="media")
+
+    __table_args__ = (
+        Index("ix_media_user_created", "user_id", "created_at"),
+        # Pending uploads not yet attached to a message, for cleanup
+        Index(
+            "ix_media_pending",
+            "user_id",
+            "created_at",
+            postgresql_where=text("message_id IS NULL AND processing_status = 'pending'"),
+        ),
+    )
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, ForeignKey, String, Text, Uuid
+from sqlalchemy import Boolean, ForeignKey, Index, String, Text, Uuid, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
@@ -21,3 +21,19 @@ class ModerationLog(Base):
     reason: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     detection_method: Mapped[str] = mapped_column(String(20), default="ai", nullable=False)
+
+    __table_args__ = (
+        # Partial indexes covering the blocked-message analytics queries
+        Index(
+            "ix_modlog_blocked_cat_created",
+            "category",
+            "created_at",
+            postgresql_where=text("is_blocked = true AND category IS NOT NULL"),
+        ),
+        Index(
+            "ix_modlog_blocked_user_created",
+            "user_id",
+            "created_at",
+            postgresql_where=text("is_blocked = true"),
+        ),
+    )
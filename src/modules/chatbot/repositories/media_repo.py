@@ -4,8 +4,10 @@ from typing import Any
 
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from src.core.repository import BaseRepository
+from src.modules.chatbot.enums import ProcessingStatus
 from src.modules.chatbot.models import MediaUpload
 
 
@@ -29,25 +31,50 @@ class MediaRepository(BaseRepository[MediaUpload]):
             storage_path=storage_path,
             mime_type=mime_type,
             file_size_bytes=file_size_bytes,
-            processing_status="pending",
+            processing_status=ProcessingStatus.PENDING,
         )
         return await self.create(media)
 
-    async def attach_to_message_no_commit(self, upload_id: uuid.UUID, message_id: uuid.UUID) -> MediaUpload | None:
-        """Link pending upload to a message."""
+    async def attach_many_to_message_no_commit(self, upload_ids: list[uuid.UUID], message_id: uuid.UUID) -> None:
+        """Link several pending uploads to a message with a single UPDATE."""
+        if not upload_ids:
+            return
+
         await self.db.execute(
             update(self.model)
-            .where(self.model.id == upload_id)
-            .values(message_id=message_id, processing_status="attached")
+            .where(self.model.id.in_(upload_ids))
+            .values(message_id=message_id, processing_status=ProcessingStatus.ATTACHED)
         )
 
-        result = await self.db.scalars(select(self.model).where(self.model.id == upload_id))
-        return result.one_or_none()
+    async def get_many(
+        self, upload_ids: list[uuid.UUID], user_id: uuid.UUID | None = None
+    ) -> dict[uuid.UUID, MediaUpload]:
+        """Get several uploads in a single query.
+
+        Args:
+            upload_ids: UUIDs of the uploads
+            user_id: If given, only uploads owned by this user are returned
+
+        Returns:
+            Mapping of upload id to MediaUpload; unknown (or foreign) ids are omitted
+        """
+        if not upload_ids:
+            return {}
+
+        query = select(self.model).options(raiseload("*")).where(self.model.id.in_(upload_ids))
+        if user_id is not None:
+            query = query.where(self.model.user_id == user_id)
+
+        result = await self.db.scalars(query)
+        return {media.id: media for media in result.all()}
 
     async def get_by_message(self, message_id: uuid.UUID) -> list[MediaUpload]:
         """Get all media attached to a message."""
         result = await self.db.scalars(
-            select(self.model).where(self.model.message_id == message_id).order_by(self.model.created_at)
+            select(self.model)
+            .options(raiseload("*"))
+            .where(self.model.message_id == message_id)
+            .order_by(self.model.created_at)
         )
         return list(result.all())
 
@@ -55,9 +82,10 @@ class MediaRepository(BaseRepository[MediaUpload]):
         """Get user's recent pending uploads (for cleanup)."""
         result = await self.db.scalars(
             select(self.model)
+            .options(raiseload("*"))
             .where(self.model.user_id == user_id)
             .where(self.model.message_id.is_(None))
-            .where(self.model.processing_status == "pending")
+            .where(self.model.processing_status == ProcessingStatus.PENDING)
             .where(self.model.created_at >= created_after)
         )
         return list(result.all())
@@ -78,13 +106,16 @@ class MediaRepository(BaseRepository[MediaUpload]):
             storage_path=storage_path,
             mime_type=mime_type,
             file_size_bytes=file_size_bytes,
-            processing_status="pending",
+            processing_status=ProcessingStatus.PENDING,
         )
         return await self.create(media)
 
     async def get_message_media(self, message_id: uuid.UUID) -> list[MediaUpload]:
         result = await self.db.scalars(
-            select(self.model).where(self.model.message_id == message_id).order_by(self.model.created_at)
+            select(self.model)
+            .options(raiseload("*"))
+            .where(self.model.message_id == message_id)
+            .order_by(self.model.created_at)
         )
         return list(result.all())
 
@@ -101,7 +132,7 @@ class MediaRepository(BaseRepository[MediaUpload]):
         Returns:
             List of MediaUpload objects
         """
-        query = select(self.model).where(self.model.user_id == user_id)
+        query = select(self.model).options(raiseload("*")).where(self.model.user_id == user_id)
 
         if mime_type:
             query = query.where(self.model.mime_type.startswith(mime_type))
@@ -114,7 +145,8 @@ class MediaRepository(BaseRepository[MediaUpload]):
     async def get_pending_processing(self, limit: int = 10) -> list[MediaUpload]:
         result = await self.db.scalars(
             select(self.model)
-            .where(self.model.processing_status == "pending")
+            .options(raiseload("*"))
+            .where(self.model.processing_status == ProcessingStatus.PENDING)
             .order_by(self.model.created_at)
             .limit(limit)
         )
@@ -123,7 +155,7 @@ class MediaRepository(BaseRepository[MediaUpload]):
     async def update_status_no_commit(
         self,
         media_id: uuid.UUID,
-        status: str,
+        status: ProcessingStatus,
         extracted_text: str | None = None,
         extracted_data: dict | None = None,
         error_message: str | None = None,
@@ -140,5 +172,7 @@ class MediaRepository(BaseRepository[MediaUpload]):
         await self.db.execute(update(self.model).where(self.model.id == media_id).values(**values))
 
     async def get_by_storage_path(self, storage_path: str) -> MediaUpload | None:
-        result = await self.db.scalars(select(self.model).where(self.model.storage_path == storage_path))
+        result = await self.db.scalars(
+            select(self.model).options(raiseload("*")).where(self.model.storage_path == storage_path)
+        )
         return result.one_or_none()
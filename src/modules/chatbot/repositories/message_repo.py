@@ -1,12 +1,15 @@
 import uuid
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import raiseload, selectinload
 
 from src.core.repository import BaseRepository
-from src.modules.chatbot.models import ChatMessage
+from src.core.utils.str import escape_like
+from src.modules.chatbot.enums import MessageRole
+from src.modules.chatbot.models import ChatMessage, ChatThread
 
 
 class MessageRepository(BaseRepository[ChatMessage]):
@@ -16,29 +19,67 @@ class MessageRepository(BaseRepository[ChatMessage]):
     async def create_message(
         self,
         thread_id: uuid.UUID,
-        role: str,
+        role: MessageRole,
         content: str,
-        attachments: list[dict] | None = None,
         tokens_used: int | None = None,
         model_used: str | None = None,
         response_time_ms: int | None = None,
     ) -> ChatMessage:
-        message = ChatMessage(
+        message = await self.create_message_no_commit(
             thread_id=thread_id,
             role=role,
             content=content,
-            attachments=attachments or [],
             tokens_used=tokens_used,
             model_used=model_used,
             response_time_ms=response_time_ms,
         )
-        return await self.create(message)
+        await self.db.commit()
+        return message
+
+    async def create_message_no_commit(
+        self,
+        thread_id: uuid.UUID,
+        role: MessageRole,
+        content: str,
+        tokens_used: int | None = None,
+        model_used: str | None = None,
+        response_time_ms: int | None = None,
+    ) -> ChatMessage:
+        [message] = await self.create_messages_no_commit(
+            [
+                {
+                    "thread_id": thread_id,
+                    "role": role,
+                    "content": content,
+                    "tokens_used": tokens_used,
+                    "model_used": model_used,
+                    "response_time_ms": response_time_ms,
+                }
+            ]
+        )
+        return message
+
+    async def create_messages_no_commit(self, rows: list[dict[str, Any]]) -> list[ChatMessage]:
+        """Insert messages with one INSERT ... RETURNING statement.
+
+        Args:
+            rows: Column values for each message
+
+        Returns:
+            The inserted ChatMessage objects, with server defaults populated
+        """
+        result = await self.db.scalars(insert(self.model).returning(self.model, sort_by_parameter_order=True), rows)
+        return list(result.all())
 
     async def get_thread_messages(
         self, thread_id: uuid.UUID, limit: int = 50, before_timestamp: datetime | None = None
     ) -> list[ChatMessage]:
         """Get thread messages with media attachments eagerly loaded."""
-        query = select(self.model).options(joinedload(ChatMessage.media)).where(self.model.thread_id == thread_id)
+        query = (
+            select(self.model)
+            .options(selectinload(ChatMessage.media), raiseload("*"))
+            .where(self.model.thread_id == thread_id)
+        )
 
         if before_timestamp:
             query = query.where(self.model.created_at < before_timestamp)
@@ -46,26 +87,49 @@ class MessageRepository(BaseRepository[ChatMessage]):
         query = query.order_by(self.model.created_at.desc()).limit(limit)
 
         result = await self.db.scalars(query)
-        messages = list(result.unique().all())
-
-        return list(reversed(messages))
+        # Rows arrive newest first; flip the single list in place to return them oldest first
+        messages = list(result)
+        messages.reverse()
+        return messages
 
     async def get_recent_messages(self, thread_id: uuid.UUID, limit: int = 10) -> list[ChatMessage]:
         """Get recent messages with media attachments eagerly loaded."""
         result = await self.db.scalars(
             select(self.model)
-            .options(joinedload(ChatMessage.media))
+            .options(selectinload(ChatMessage.media), raiseload("*"))
             .where(self.model.thread_id == thread_id)
             .order_by(self.model.created_at.desc())
             .limit(limit)
         )
-        messages = list(result.unique().all())
-        return list(reversed(messages))
+        messages = list(result)
+        messages.reverse()
+        return messages
 
-    async def count_thread_messages(self, thread_id: uuid.UUID) -> int:
-        from sqlalchemy import func
+    async def get_last_messages(self, thread_ids: list[uuid.UUID]) -> dict[uuid.UUID, ChatMessage]:
+        """Get the most recent message of each thread in a single query.
+
+        Args:
+            thread_ids: UUIDs of the threads
+
+        Returns:
+            Mapping of thread id to its latest message; threads without messages are omitted
+        """
+        if not thread_ids:
+            return {}
+
+        result = await self.db.scalars(
+            select(self.model)
+            .options(raiseload("*"))
+            .where(self.model.thread_id.in_(thread_ids))
+            .distinct(self.model.thread_id)
+            .order_by(self.model.thread_id, self.model.created_at.desc())
+        )
+        return {message.thread_id: message for message in result.all()}
 
-        result = await self.db.scalar(select(func.count(self.model.id)).where(self.model.thread_id == thread_id))
+    async def count_thread_messages(self, thread_id: uuid.UUID) -> int:
+        # Read the counter maintained by ThreadRepository.update_after_message_no_commit
+        # instead of counting the thread's messages
+        result = await self.db.scalar(select(ChatThread.message_count).where(ChatThread.id == thread_id))
         return result or 0
 
     async def search_in_thread(self, thread_id: uuid.UUID, search_term: str, limit: int = 50) -> list[ChatMessage]:
@@ -79,13 +143,16 @@ class MessageRepository(BaseRepository[ChatMessage]):
         Returns:
             List of ChatMessage objects matching the search
         """
-        # Escape backslash first, then wildcards
-        safe_search = search_term.replace("\\", "\\\\").replace("%", r"\%").replace("_", r"\_")
+        # '%%' would match every row, so there is nothing to search for
+        if not search_term.strip():
+            return []
+
+        safe_search = escape_like(search_term)
 
         result = await self.db.scalars(
             select(self.model)
             .where(self.model.thread_id == thread_id)
-            .where(self.model.content.ilike(f"%{safe_search}%"))
+            .where(self.model.content.ilike(f"%{safe_search}%", escape="\\"))
             .order_by(self.model.created_at.desc())
             .limit(limit)
         )
@@ -95,4 +162,4 @@ class MessageRepository(BaseRepository[ChatMessage]):
         result = await self.db.scalars(
             select(self.model).where(self.model.thread_id == thread_id).order_by(self.model.created_at.desc()).limit(1)
         )
-        return result.one_or_none()
+        return result.first()
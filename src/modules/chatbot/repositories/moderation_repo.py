@@ -38,7 +38,7 @@ class ModerationLogRepository(BaseRepository[ModerationLog]):
         """Get count of blocked messages for a user in last N days."""
         since = datetime.now(UTC) - timedelta(days=days)
         result = await self.db.scalar(
-            select(func.count(self.model.id))
+            select(func.count())
             .where(self.model.user_id == user_id)
             .where(self.model.is_blocked.is_(True))
             .where(self.model.created_at >= since)
@@ -49,7 +49,7 @@ class ModerationLogRepository(BaseRepository[ModerationLog]):
         """Get blocked message counts by category for analytics."""
         since = datetime.now(UTC) - timedelta(days=days)
         result = await self.db.execute(
-            select(self.model.category, func.count(self.model.id))
+            select(self.model.category, func.count())
             .where(self.model.is_blocked.is_(True))
             .where(self.model.category.isnot(None))
             .where(self.model.created_at >= since)
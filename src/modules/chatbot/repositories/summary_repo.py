@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.repository import BaseRepository
@@ -36,7 +36,7 @@ class SummaryRepository(BaseRepository[ChatSummary]):
         result = await self.db.scalars(
             select(self.model).where(self.model.thread_id == thread_id).order_by(self.model.created_at.desc()).limit(1)
         )
-        return result.one_or_none()
+        return result.first()
 
     async def get_all_summaries(self, thread_id: uuid.UUID) -> list[ChatSummary]:
         result = await self.db.scalars(
@@ -45,13 +45,10 @@ class SummaryRepository(BaseRepository[ChatSummary]):
         return list(result.all())
 
     async def has_summary(self, thread_id: uuid.UUID) -> bool:
-        from sqlalchemy import func
-
-        count = await self.db.scalar(select(func.count(self.model.id)).where(self.model.thread_id == thread_id))
-        return (count or 0) > 0
+        # Stop at the first matching row rather than counting them all
+        found = await self.db.scalar(select(literal(1)).where(self.model.thread_id == thread_id).limit(1))
+        return found is not None
 
     async def count_summaries(self, thread_id: uuid.UUID) -> int:
-        from sqlalchemy import func
-
         result = await self.db.scalar(select(func.count(self.model.id)).where(self.model.thread_id == thread_id))
         return result or 0
@@ -1,11 +1,13 @@
 import uuid
 from datetime import datetime
+from typing import Any
 
-from dateutil.tz import UTC
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from src.core.repository import BaseRepository
+from src.core.utils.str import escape_like
 from src.modules.chatbot.models import ChatThread
 
 
@@ -20,7 +22,8 @@ class ThreadRepository(BaseRepository[ChatThread]):
     async def get_by_user(
         self, user_id: uuid.UUID, include_archived: bool = False, skip: int = 0, limit: int = 50
     ) -> list[ChatThread]:
-        query = select(self.model).where(self.model.user_id == user_id)
+        # Overrides the selectin default on ChatThread.messages so listing doesn't load every message
+        query = select(self.model).options(raiseload("*")).where(self.model.user_id == user_id)
 
         if not include_archived:
             query = query.where(self.model.is_archived.is_(False))
@@ -32,9 +35,13 @@ class ThreadRepository(BaseRepository[ChatThread]):
 
     async def get_user_thread(self, thread_id: uuid.UUID, user_id: uuid.UUID) -> ChatThread | None:
         result = await self.db.scalars(
-            select(self.model).where(self.model.id == thread_id).where(self.model.user_id == user_id)
+            select(self.model)
+            .options(raiseload("*"))
+            .where(self.model.id == thread_id)
+            .where(self.model.user_id == user_id)
+            .limit(1)
         )
-        return result.one_or_none()
+        return result.first()
 
     async def search_threads(self, user_id: uuid.UUID, search_term: str, limit: int = 20) -> list[ChatThread]:
         """Search threads by title.
@@ -47,21 +54,23 @@ class ThreadRepository(BaseRepository[ChatThread]):
         Returns:
             List of ChatThread objects matching the search
         """
-        # Escape backslash first, then wildcards
-        safe_search = search_term.replace("\\", "\\\\").replace("%", r"\%").replace("_", r"\_")
+        # '%%' would match every row, so there is nothing to search for
+        if not search_term.strip():
+            return []
+
+        safe_search = escape_like(search_term)
 
         result = await self.db.scalars(
             select(self.model)
+            .options(raiseload("*"))
             .where(self.model.user_id == user_id)
-            .where(self.model.title.ilike(f"%{safe_search}%"))
+            .where(self.model.title.ilike(f"%{safe_search}%", escape="\\"))
             .order_by(self.model.updated_at.desc())
             .limit(limit)
         )
         return list(result.all())
 
     async def count_user_threads(self, user_id: uuid.UUID, include_archived: bool = False) -> int:
-        from sqlalchemy import func
-
         query = select(func.count(self.model.id)).where(self.model.user_id == user_id)
 
         if not include_archived:
@@ -70,26 +79,31 @@ class ThreadRepository(BaseRepository[ChatThread]):
         result = await self.db.scalar(query)
         return result or 0
 
+    # updated_at is filled by the column's onupdate=func.now(), so Postgres stamps it instead of Python
     async def archive_thread(self, thread_id: uuid.UUID) -> None:
-        await self.db.execute(
-            update(self.model)
-            .where(self.model.id == thread_id)
-            .values(is_archived=True, updated_at=datetime.now(tz=UTC))
-        )
+        await self.db.execute(update(self.model).where(self.model.id == thread_id).values(is_archived=True))
 
     async def update_title_no_commit(self, thread_id: uuid.UUID, title: str) -> None:
-        await self.db.execute(
-            update(self.model).where(self.model.id == thread_id).values(title=title, updated_at=datetime.now(tz=UTC))
-        )
+        await self.db.execute(update(self.model).where(self.model.id == thread_id).values(title=title))
 
-    async def increment_message_count_no_commit(self, thread_id: uuid.UUID, count: int = 1) -> None:
-        await self.db.execute(
-            update(self.model)
-            .where(self.model.id == thread_id)
-            .values(message_count=self.model.message_count + count, updated_at=datetime.now(tz=UTC))
-        )
+    async def update_after_message_no_commit(
+        self, thread_id: uuid.UUID, count: int, title: str | None = None
+    ) -> int | None:
+        """Bump the message counter, and optionally set the title, in one UPDATE.
+
+        Args:
+            thread_id: UUID of the thread
+            count: Number of messages added
+            title: New title, if one is ready
+
+        Returns:
+            The updated message count, or None if the thread doesn't exist
+        """
+        values: dict[str, Any] = {"message_count": self.model.message_count + count}
+        if title:
+            values["title"] = title
 
-    async def touch_no_commit(self, thread_id: uuid.UUID) -> None:
-        await self.db.execute(
-            update(self.model).where(self.model.id == thread_id).values(updated_at=datetime.now(tz=UTC))
+        result = await self.db.execute(
+            update(self.model).where(self.model.id == thread_id).values(**values).returning(self.model.message_count)
         )
+        return result.scalar_one_or_none()
@@ -1,7 +1,11 @@
-import io
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import FormData, UploadFile
+from starlette.formparsers import MultiPartException, MultiPartParser
+from starlette.types import Message
 
 from src.core.config import settings
 from src.core.database import get_db
@@ -15,31 +19,97 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/chat", tags=["Chatbot"])
 
-ALLOWED_MIME_TYPES = {
-    # Images
-    "image/jpeg",
-    "image/png",
-    "image/webp",
-    "image/gif",
-    # Documents
-    "application/pdf",
-    "text/plain",
-    "text/csv",
-    # Video
-    "video/mp4",
-    "video/webm",
-    "video/quicktime",
-    # Audio
-    "audio/mpeg",
-    "audio/wav",
-    "audio/webm",
-    "audio/ogg",
+ALLOWED_MIME_TYPES: frozenset[str] = frozenset(
+    {
+        # Images
+        "image/jpeg",
+        "image/png",
+        "image/webp",
+        "image/gif",
+        # Documents
+        "application/pdf",
+        "text/plain",
+        "text/csv",
+        # Video
+        "video/mp4",
+        "video/webm",
+        "video/quicktime",
+        # Audio
+        "audio/mpeg",
+        "audio/wav",
+        "audio/webm",
+        "audio/ogg",
+    }
+)
+
+
+# Slack for multipart boundaries and part headers on top of the file itself
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# Parts up to this size are spooled in memory; only larger ones roll over to disk
+UPLOAD_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+UPLOAD_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "multipart/form-data": {
+            "schema": {
+                "type": "object",
+                "properties": {"file": {"type": "string", "format": "binary"}},
+                "required": ["file"],
+            }
+        }
+    },
 }
 
 
-@router.post("/upload")
+def _limit_body(request: Request, max_body_size: int) -> Request:
+    """Wrap a request so reading more than max_body_size bytes aborts with 413."""
+    received = 0
+
+    async def receive() -> Message:
+        nonlocal received
+        message = await request.receive()
+        received += len(message.get("body", b""))
+        if received > max_body_size:
+            raise HTTPException(status_code=413, detail=f"File too large. Max size: {settings.CHAT_MAX_FILE_SIZE_MB}MB")
+        return message
+
+    return Request(request.scope, receive=receive)
+
+
+class _UploadParser(MultiPartParser):
+    """Multipart parser that keeps parts up to UPLOAD_SPOOL_MAX_BYTES in memory.
+
+    Once a spooled file has rolled over to disk, Starlette hands every chunk
+    write to the threadpool, so the default 1 MiB threshold costs a thread hop
+    per received chunk for most uploads.
+    """
+
+    spool_max_size = UPLOAD_SPOOL_MAX_BYTES
+
+
+@asynccontextmanager
+async def _parse_upload_form(request: Request, max_body_size: int) -> AsyncGenerator[FormData]:
+    """Parse a single-file multipart body, closing the spooled file afterwards."""
+    if not request.headers.get("content-type", "").startswith("multipart/form-data"):
+        raise HTTPException(status_code=400, detail="No file provided")
+
+    parser = _UploadParser(request.headers, _limit_body(request, max_body_size).stream(), max_files=1, max_fields=1)
+    try:
+        form = await parser.parse()
+    except MultiPartException as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+    try:
+        yield form
+    finally:
+        await form.close()
+
+
+@router.post("/upload", openapi_extra={"requestBody": UPLOAD_REQUEST_BODY})
 async def upload_file(
-    file: UploadFile = File(...),
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -48,34 +118,54 @@ async def upload_file(
     Upload images, documents, videos, or audio files to attach in chat messages.
     The AI can analyze image content, read documents, and transcribe audio.
 
+    The multipart body is parsed here rather than by FastAPI, so authentication runs
+    before any of it is read and oversized bodies are cut off while streaming. Parts
+    spool in memory (or a temporary file past UPLOAD_SPOOL_MAX_BYTES) and are streamed
+    from there to storage.
+
     **Flow:**
     1. Upload file to this endpoint
     2. Receive upload_id in response
     3. Include upload_id in WebSocket send_message event
     4. AI processes file in conversation context
     """
+    max_size = settings.CHAT_MAX_FILE_SIZE_MB * 1024 * 1024
+    max_body_size = max_size + MULTIPART_OVERHEAD_BYTES
+
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_body_size:
+        raise HTTPException(status_code=413, detail=f"File too large. Max size: {settings.CHAT_MAX_FILE_SIZE_MB}MB")
+
     try:
-        if file.content_type not in ALLOWED_MIME_TYPES:
-            raise HTTPException(status_code=400, detail=f"Unsupported file type: {file.content_type}")
-
-        contents = await file.read()
-        file_size = len(contents)
-
-        max_size = settings.CHAT_MAX_FILE_SIZE_MB * 1024 * 1024
-        if file_size > max_size:
-            raise HTTPException(status_code=400, detail=f"File too large. Max size: {settings.CHAT_MAX_FILE_SIZE_MB}MB")
-
-        if file_size == 0:
-            raise HTTPException(status_code=400, detail="Empty file not allowed")
-
-        file_obj = io.BytesIO(contents)
-        storage_url = await storage_service.upload_file(
-            file_obj=file_obj,
-            filename=file.filename or "upload",
-            content_type=file.content_type or "application/octet-stream",
-            folder=f"chat_uploads/{current_user.id}",
-            use_private=True,  # Use private bucket for chat uploads
-        )
+        async with _parse_upload_form(request, max_body_size) as form:
+            file = form.get("file")
+            if not isinstance(file, UploadFile):
+                raise HTTPException(status_code=400, detail="No file provided")
+
+            # Drop parameters such as "; charset=utf-8" before checking the type
+            content_type = (file.content_type or "").partition(";")[0].strip().lower()
+            if content_type not in ALLOWED_MIME_TYPES:
+                raise HTTPException(status_code=400, detail=f"Unsupported file type: {file.content_type}")
+
+            # Counted by the multipart parser while spooling, no need to read the file back
+            file_size = file.size or 0
+
+            if file_size > max_size:
+                raise HTTPException(
+                    status_code=413, detail=f"File too large. Max size: {settings.CHAT_MAX_FILE_SIZE_MB}MB"
+                )
+
+            if file_size == 0:
+                raise HTTPException(status_code=400, detail="Empty file not allowed")
+
+            storage_url = await storage_service.upload_file(
+                file_obj=file.file,
+                filename=file.filename or "upload",
+                content_type=content_type,
+                folder=f"chat_uploads/{current_user.id}",
+                use_private=True,  # Use private bucket for chat uploads
+                size=file_size,
+            )
 
         logger.info(f"Uploaded file to GCS: {storage_url} (user={current_user.id}, size={file_size})")
 
@@ -84,7 +174,7 @@ async def upload_file(
             user_id=current_user.id,
             original_filename=file.filename or "upload",
             storage_path=storage_url,
-            mime_type=file.content_type or "application/octet-stream",
+            mime_type=content_type,
             file_size_bytes=file_size,
         )
 
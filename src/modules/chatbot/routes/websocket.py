@@ -166,6 +166,11 @@ async def get_chatbot_docs():
        {"type": "pong"}
        ```
 
+    10. Queued (the server is at its AI stream limit; chunks follow once a slot frees up)
+       ```json
+       {"type": "queued"}
+       ```
+
     **Rate Limits:**
     - 10 messages per minute
     - 100 messages per day
@@ -1,4 +1,4 @@
-from src.modules.chatbot.services.agent_service import ChatAgentService
+from src.modules.chatbot.services.agent_service import ChatAgentService, chat_agent_service
 from src.modules.chatbot.services.chat_service import ChatService
 from src.modules.chatbot.services.context_providers import UserProfileProvider
 from src.modules.chatbot.services.context_service import ChatContextService, ContextProvider
@@ -9,4 +9,5 @@ __all__ = [
     "ChatService",
     "ContextProvider",
     "UserProfileProvider",
+    "chat_agent_service",
 ]
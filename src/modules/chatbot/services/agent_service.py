@@ -1,3 +1,4 @@
+import asyncio
 import time
 from typing import Any
 
@@ -9,11 +10,127 @@ from pydantic_ai.providers.google import GoogleProvider
 
 from src.core.config import settings
 from src.core.logging import get_logger
+from src.core.websocket import send_json
 
 logger = get_logger(__name__)
 
 FileAttachment = ImageUrl | DocumentUrl | VideoUrl | AudioUrl
 
+# Coalesce streamed deltas into one assistant_chunk per this many characters or seconds
+CHUNK_BATCH_MAX_CHARS = 8192
+CHUNK_BATCH_MAX_DELAY = 0.02
+
+_CHAT_MODEL_SETTINGS = GoogleModelSettings(
+    google_safety_settings=[  # type: ignore[typeddict-item]
+        {
+            "category": HarmCategory.HARM_CATEGORY_HATE_SPEECH,
+            "threshold": HarmBlockThreshold.BLOCK_ONLY_HIGH,
+        },
+        {
+            "category": HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
+            "threshold": HarmBlockThreshold.BLOCK_ONLY_HIGH,
+        },
+        {
+            "category": HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
+            "threshold": HarmBlockThreshold.BLOCK_ONLY_HIGH,
+        },
+        {
+            "category": HarmCategory.HARM_CATEGORY_HARASSMENT,
+            "threshold": HarmBlockThreshold.BLOCK_ONLY_HIGH,
+        },
+    ]
+)
+
+
+# Bounds in-flight Gemini streams per process to protect quota and memory under bursts
+_stream_slots = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY)
+
+# Summary prompts use the last SUMMARY_MAX_MESSAGES messages, or only the last
+# SUMMARY_MAX_MESSAGES_LONG when those hold more than SUMMARY_LONG_TRANSCRIPT_CHARS
+SUMMARY_MAX_MESSAGES = 20
+SUMMARY_MAX_MESSAGES_LONG = 10
+SUMMARY_LONG_TRANSCRIPT_CHARS = 4000
+SUMMARY_MESSAGE_MAX_CHARS = 150
+
+
+def _summary_transcript(messages: list[dict[str, Any]]) -> str:
+    """Build a compact transcript for the summary prompt.
+
+    Messages are cut to SUMMARY_MESSAGE_MAX_CHARS, roles shortened to one letter
+    and consecutive messages from the same role merged onto one line, since the
+    prompt size dominates the LOW model's latency.
+    """
+    recent = messages[-SUMMARY_MAX_MESSAGES:]
+    if sum(len(msg["content"]) for msg in recent) > SUMMARY_LONG_TRANSCRIPT_CHARS:
+        recent = recent[-SUMMARY_MAX_MESSAGES_LONG:]
+
+    picked = [(str(msg["role"])[:1].upper(), msg["content"][:SUMMARY_MESSAGE_MAX_CHARS]) for msg in recent]
+
+    lines: list[tuple[str, list[str]]] = []
+    for role, content in picked:
+        if lines and lines[-1][0] == role:
+            lines[-1][1].append(content)
+        else:
+            lines.append((role, [content]))
+
+    return "\n".join(f"{role}: {' '.join(contents)}" for role, contents in lines)
+
+
+class _ChunkBatcher:
+    """Buffer text deltas and send them as fewer, larger assistant_chunk messages.
+
+    A batch is sent once it reaches max_chars, or max_delay seconds after its first
+    delta arrived so a pause in the model stream never holds text back. Sends go
+    through a lock so batches always reach the socket in order.
+    """
+
+    def __init__(self, websocket: WebSocket, max_chars: int, max_delay: float):
+        self._websocket = websocket
+        self._max_chars = max_chars
+        self._max_delay = max_delay
+        self._buffer: list[str] = []
+        self._pending_chars = 0
+        self._timer: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    async def add(self, text: str) -> None:
+        self._buffer.append(text)
+        self._pending_chars += len(text)
+
+        if self._pending_chars >= self._max_chars:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """Send whatever is buffered now."""
+        # A timer that is still set has not started sending, so cancelling it is safe
+        self.cancel()
+        await self._send()
+
+    def cancel(self) -> None:
+        """Drop a scheduled send, e.g. when the stream failed part way."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._max_delay)
+        self._timer = None
+        try:
+            await self._send()
+        except Exception as e:
+            logger.warning(f"Failed to send buffered assistant chunk: {e}")
+
+    async def _send(self) -> None:
+        async with self._lock:
+            if not self._buffer:
+                return
+            content = "".join(self._buffer)
+            self._buffer.clear()
+            self._pending_chars = 0
+            await send_json(self._websocket, {"type": "assistant_chunk", "content": content})
+
 
 class ChatAgentService:
     """Pydantic AI wrapper for streaming chat responses.
@@ -26,34 +143,13 @@ class ChatAgentService:
     """
 
     def __init__(self):
-        model_settings = GoogleModelSettings(
-            google_safety_settings=[  # type: ignore[typeddict-item]
-                {
-                    "category": HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-                    "threshold": HarmBlockThreshold.BLOCK_ONLY_HIGH,
-                },
-                {
-                    "category": HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-                    "threshold": HarmBlockThreshold.BLOCK_ONLY_HIGH,
-                },
-                {
-                    "category": HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-                    "threshold": HarmBlockThreshold.BLOCK_ONLY_HIGH,
-                },
-                {
-                    "category": HarmCategory.HARM_CATEGORY_HARASSMENT,
-                    "threshold": HarmBlockThreshold.BLOCK_ONLY_HIGH,
-                },
-            ]
-        )
-
         # Create Google provider with API key from settings
         google_provider = GoogleProvider(api_key=settings.GOOGLE_API_KEY)
 
         self.agent = Agent(
             model=GoogleModel(model_name=settings.GEMINI_CHAT_MODEL, provider=google_provider),
             output_type=str,
-            model_settings=model_settings,
+            model_settings=_CHAT_MODEL_SETTINGS,
         )
 
         self.title_agent = Agent(
@@ -75,7 +171,8 @@ class ChatAgentService:
 
         This is the CORE method that:
         1. Calls Pydantic AI with streaming enabled
-        2. Sends each text chunk to WebSocket as it arrives (like Claude/ChatGPT)
+        2. Sends text chunks to WebSocket as they arrive, coalescing deltas that land
+           within a few milliseconds of each other into a single message
         3. Returns final response + metrics after completion
 
         Args:
@@ -87,13 +184,13 @@ class ChatAgentService:
         Returns:
             tuple: (full_response, tokens_used, response_time_ms)
 
-        Example WebSocket messages sent:
-            {"type": "assistant_chunk", "content": "Bug"}
-            {"type": "assistant_chunk", "content": "ün"}
+        Example WebSocket messages sent (deltas arriving together are merged):
+            {"type": "assistant_chunk", "content": "Bugün"}
             {"type": "assistant_chunk", "content": " koş"}
         """
         start_time = time.time()
-        full_response = ""
+        batcher = _ChunkBatcher(websocket, CHUNK_BATCH_MAX_CHARS, CHUNK_BATCH_MAX_DELAY)
+        chunks: list[str] = []
 
         try:
             file_count = len(files) if files else 0
@@ -101,15 +198,26 @@ class ChatAgentService:
 
             message: str | list[Any] = [user_prompt, *files] if files else user_prompt
 
-            async with self.agent.run_stream(message, instructions=system_instructions) as response:
+            # Bound once: the loop below runs for every delta of the response
+            add_to_batch = batcher.add
+            append_chunk = chunks.append
+
+            if _stream_slots.locked():
+                await send_json(websocket, {"type": "queued"})
+
+            async with _stream_slots, self.agent.run_stream(message, instructions=system_instructions) as response:
                 async for text_chunk in response.stream_text(delta=True):
                     if text_chunk:
-                        await websocket.send_json({"type": "assistant_chunk", "content": text_chunk})
-                        full_response += text_chunk
+                        await add_to_batch(text_chunk)
+                        append_chunk(text_chunk)
+
+                # Everything must be on the wire before the caller sends message_complete
+                await batcher.flush()
 
                 usage = response.usage()
                 tokens_used = usage.total_tokens if usage else 0
 
+            full_response = "".join(chunks)
             response_time_ms = int((time.time() - start_time) * 1000)
 
             logger.info(f"AI stream completed: {len(full_response)} chars, {tokens_used} tokens, {response_time_ms}ms")
@@ -120,6 +228,10 @@ class ChatAgentService:
             logger.error(f"AI streaming error: {e}", exc_info=True)
             raise
 
+        finally:
+            # No-op after the final flush; drops a pending send if the stream failed or was cancelled
+            batcher.cancel()
+
     async def generate_thread_title(self, first_message: str) -> str:
         """Generate short title from first message using LOW model.
 
@@ -160,14 +272,12 @@ class ChatAgentService:
             Generated summary (max 500 characters)
         """
         try:
-            # Build conversation context
-            conversation_text = "\n".join(
-                [f"{msg['role']}: {msg['content'][:200]}" for msg in messages[-20:]]  # Last 20 messages
-            )
+            conversation_text = _summary_transcript(messages)
 
             prompt = (
                 f"Summarize this conversation in 2-3 sentences (max 100 words). "
-                f"Focus on key topics discussed and main outcomes.\n\n{conversation_text}"
+                f"Focus on key topics discussed and main outcomes. "
+                f"Lines start with U (user) or A (assistant).\n\n{conversation_text}"
             )
 
             result = await self.title_agent.run(prompt)
@@ -179,3 +289,7 @@ class ChatAgentService:
         except Exception as e:
             logger.warning(f"Summary generation failed: {e}")
             return "Summary generation failed. Please try again later."
+
+
+# Agents are stateless between runs, so one instance serves every chat turn in the process
+chat_agent_service = ChatAgentService()
@@ -1,23 +1,60 @@
+import asyncio
 import uuid
 from datetime import datetime
 from logging import Logger
+from typing import TYPE_CHECKING
 
 from fastapi import WebSocket
+from fastapi.concurrency import run_in_threadpool
 from pydantic_ai import AudioUrl, DocumentUrl, ImageUrl, VideoUrl
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
 from src.core.exception import NotFoundError
 from src.core.logging import get_logger
+from src.core.services.redis_service import redis_service
 from src.core.services.storage import storage_service
+from src.core.websocket import send_json
+from src.modules.chatbot.enums import MessageRole
 from src.modules.chatbot.repositories import MediaRepository, MessageRepository, SummaryRepository, ThreadRepository
-from src.modules.chatbot.services.agent_service import ChatAgentService, FileAttachment
+from src.modules.chatbot.services.agent_service import ChatAgentService, FileAttachment, chat_agent_service
 from src.modules.chatbot.services.context_service import ChatContextService
 from src.modules.chatbot.services.moderation_service import ModerationService
+from src.modules.chatbot.tasks import summarize_thread
 from src.modules.users.models import User
 
+if TYPE_CHECKING:
+    from src.modules.chatbot.models import ChatThread, MediaUpload
+
 logger: Logger = get_logger(__name__)
 
+SUMMARY_DEBOUNCE_PREFIX = "chat:summary_queued"
+
+# Attachment class by MIME major type; documents need the full type and are handled separately
+_MIME_TO_ATTACHMENT: dict[str, type[ImageUrl | VideoUrl | AudioUrl]] = {
+    "image": ImageUrl,
+    "video": VideoUrl,
+    "audio": AudioUrl,
+}
+
+
+def _attachment_for(mime_type: str, url: str) -> FileAttachment | None:
+    """Wrap a signed URL in the pydantic-ai attachment type for its MIME type.
+
+    Args:
+        mime_type: MIME type of the upload
+        url: Signed URL of the upload
+
+    Returns:
+        Attachment for the AI agent, or None if the type is unsupported
+    """
+    major = mime_type.split("/", 1)[0]
+    if mime_type == "application/pdf" or major == "text":
+        return DocumentUrl(url=url, media_type=mime_type)
+
+    attachment_cls = _MIME_TO_ATTACHMENT.get(major)
+    return attachment_cls(url=url) if attachment_cls is not None else None
+
 
 class ChatService:
     """Main orchestrator for chatbot operations.
@@ -31,15 +68,15 @@ class ChatService:
     - WebSocket communication
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, agent_service: ChatAgentService | None = None):
         self.db: AsyncSession = db
         self.thread_repo = ThreadRepository(db)
         self.message_repo = MessageRepository(db)
         self.summary_repo = SummaryRepository(db)
         self.media_repo = MediaRepository(db)
         self.context_service = ChatContextService(db)
-        self.agent_service = ChatAgentService()
-        self.moderation_service = ModerationService(db)
+        self.agent_service = agent_service or chat_agent_service
+        self.moderation_service = ModerationService()
 
     async def handle_send_message(
         self,
@@ -52,16 +89,17 @@ class ChatService:
         """Handle user message + AI response with streaming.
 
         FLOW:
-        0. AI moderation check (FIRST)
+        0. AI moderation check (FIRST), concurrently loading the thread (ownership check)
+           and then building the context (summary + providers)
         1. Create thread if new (thread_id=null)
         2. Save user message to DB
         2.5. Link file attachments to message
-        3. Build context (history + health data)
-        4. Stream AI response to WebSocket (with files)
-        5. Save AI response to DB
-        6. Update thread metadata
-        7. Generate title if first message
-        8. Check if summary needed
+        3. Stream AI response to WebSocket (with files), generating the title
+           concurrently if this is the first message
+        4. Save AI response and thread metadata (plus the title if ready) in one transaction
+        5. Send message_complete
+        6. Save the title if it was still generating at step 4
+        7. Queue a background summary if needed
 
         Args:
             user: Current user
@@ -76,174 +114,213 @@ class ChatService:
         WebSocket Events Sent:
             - {"type": "moderation_blocked", ...} (if blocked)
             - {"type": "thread_created", "thread_id": "..."}
+            - {"type": "queued"} (if the AI stream has to wait for a slot)
             - {"type": "assistant_chunk", "content": "..."} (multiple times)
             - {"type": "message_complete", ...}
         """
         logger.info(f"User {user.id} sending message (thread_id={thread_id})")
 
+        # The thread lookup and instructions don't depend on the moderation verdict, so they run during the
+        # moderation call. The task owns the session until it finishes, so it is always awaited, never cancelled.
+        prepare_task = asyncio.create_task(self._load_thread_and_instructions(thread_id, user))
+
         if settings.CHAT_MODERATION_ENABLED:
-            is_safe, reason, category = await self.moderation_service.check_message_safety(
-                message=content, user_id=user.id
-            )
+            try:
+                is_safe, reason, category = await self.moderation_service.check_message_safety(
+                    message=content, user_id=user.id
+                )
+            except BaseException:
+                await asyncio.gather(prepare_task, return_exceptions=True)
+                raise
 
             if not is_safe:
+                await asyncio.gather(prepare_task, return_exceptions=True)
                 logger.warning(f"Blocked message: user={user.id}, category={category}")
 
-                await self.db.commit()
-
-                await websocket.send_json(
+                await send_json(
+                    websocket,
                     {
                         "type": "moderation_blocked",
                         "category": category,
                         "message": reason,
-                    }
+                    },
                 )
 
                 return {"blocked": True, "reason": reason, "category": category}
 
-        if not thread_id:
+        thread, system_instructions = await prepare_task
+        logger.debug(f"Built system instructions ({len(system_instructions)} chars)")
+
+        if thread is None:
             thread = await self.thread_repo.create_for_user(user_id=user.id, title="New Chat")
-            thread_id = thread.id
 
-            await websocket.send_json({"type": "thread_created", "thread_id": str(thread_id)})
-            logger.info(f"Created new thread: {thread_id}")
-        else:
-            thread = await self.thread_repo.get_user_thread(thread_id, user.id)
-            if not thread:
-                raise NotFoundError("Thread not found or access denied")
+            await send_json(websocket, {"type": "thread_created", "thread_id": thread.id})
+            logger.info(f"Created new thread: {thread.id}")
+
+        # The thread exists from here on, so its id is never None
+        thread_id = thread.id
 
-        user_message = await self.message_repo.create_message(thread_id=thread_id, role="user", content=content)
+        user_message = await self.message_repo.create_message(
+            thread_id=thread_id, role=MessageRole.USER, content=content
+        )
         logger.debug(f"Saved user message: {user_message.id}")
 
         pydantic_ai_files: list[FileAttachment] = []
         failed_attachments: list[str] = []
 
         if upload_ids:
+            parsed_ids: list[tuple[str, uuid.UUID]] = []
             for upload_id_str in upload_ids:
                 try:
-                    upload_id = uuid.UUID(upload_id_str)
-                    upload = await self.media_repo.get(upload_id)
-
-                    if not upload:
-                        error_msg = f"Upload {upload_id_str[:8]}... not found"
-                        logger.warning(f"Invalid upload_id: {upload_id}")
-                        failed_attachments.append(error_msg)
-                        continue
-
-                    if upload.user_id != user.id:
-                        error_msg = f"Upload {upload_id_str[:8]}... unauthorized"
-                        logger.warning(f"Unauthorized upload_id: {upload_id}")
-                        failed_attachments.append(error_msg)
-                        continue
-
-                    await self.media_repo.attach_to_message_no_commit(upload_id, user_message.id)
-                    logger.debug(f"Attached upload {upload_id} to message {user_message.id}")
-
-                    signed_url = await storage_service.generate_signed_url(upload.storage_path, expiration_minutes=120)
-                    logger.debug(signed_url)
-
-                    if upload.mime_type.startswith("image/"):
-                        pydantic_ai_files.append(ImageUrl(url=signed_url))
-                    elif upload.mime_type == "application/pdf" or upload.mime_type.startswith("text/"):
-                        pydantic_ai_files.append(DocumentUrl(url=signed_url, media_type=upload.mime_type))
-                    elif upload.mime_type.startswith("video/"):
-                        pydantic_ai_files.append(VideoUrl(url=signed_url))
-                    elif upload.mime_type.startswith("audio/"):
-                        pydantic_ai_files.append(AudioUrl(url=signed_url))
-                    else:
-                        error_msg = f"File {upload.original_filename} has unsupported type"
-                        logger.warning(f"Unsupported MIME type for AI: {upload.mime_type}")
-                        failed_attachments.append(error_msg)
-
+                    parsed_ids.append((upload_id_str, uuid.UUID(upload_id_str)))
                 except ValueError:
                     error_msg = f"Invalid upload ID format: {upload_id_str[:8]}..."
                     logger.warning(f"Invalid upload_id format: {upload_id_str}")
                     failed_attachments.append(error_msg)
+
+            # One IN (...) query scoped to the user instead of a lookup per id
+            uploads = await self.media_repo.get_many([upload_id for _, upload_id in parsed_ids], user_id=user.id)
+
+            attached: list[MediaUpload] = []
+            for upload_id_str, upload_id in parsed_ids:
+                upload = uploads.get(upload_id)
+
+                if not upload:
+                    error_msg = f"Upload {upload_id_str[:8]}... not found"
+                    logger.warning(f"Upload not found or not owned by user {user.id}: {upload_id}")
+                    failed_attachments.append(error_msg)
                     continue
 
+                attached.append(upload)
+
+            await self.media_repo.attach_many_to_message_no_commit([u.id for u in attached], user_message.id)
+            logger.debug(f"Attached {len(attached)} upload(s) to message {user_message.id}")
+
+            # Cache lookups and signing for all attachments happen concurrently
+            signed_urls = await storage_service.generate_signed_urls(
+                [upload.storage_path for upload in attached], expiration_minutes=120
+            )
+
+            for upload, signed_url in zip(attached, signed_urls, strict=True):
+                attachment = _attachment_for(upload.mime_type, signed_url)
+                if attachment is not None:
+                    pydantic_ai_files.append(attachment)
+                else:
+                    error_msg = f"File {upload.original_filename} has unsupported type"
+                    logger.warning(f"Unsupported MIME type for AI: {upload.mime_type}")
+                    failed_attachments.append(error_msg)
+
             logger.debug(f"Prepared {len(pydantic_ai_files)} files for AI, {len(failed_attachments)} failed")
 
             if failed_attachments:
-                await websocket.send_json(
+                await send_json(
+                    websocket,
                     {
                         "type": "attachment_warning",
                         "message": f"{len(failed_attachments)} file(s) could not be attached",
                         "failed_files": failed_attachments,
-                    }
+                    },
                 )
 
-        system_instructions = await self.context_service.build_system_instructions(thread_id, user)
-        logger.debug(f"Built system instructions ({len(system_instructions)} chars)")
-
-        (full_response, tokens, time_ms) = await self.agent_service.stream_response(
-            user_prompt=content,
-            system_instructions=system_instructions,
-            websocket=websocket,
-            files=pydantic_ai_files if pydantic_ai_files else None,
+        # The title only depends on the first message, so generate it while the reply streams
+        title_task = (
+            asyncio.create_task(self.agent_service.generate_thread_title(content))
+            if thread.message_count == 0
+            else None
         )
 
-        ai_message = await self.message_repo.create_message(
+        try:
+            (full_response, tokens, time_ms) = await self.agent_service.stream_response(
+                user_prompt=content,
+                system_instructions=system_instructions,
+                websocket=websocket,
+                files=pydantic_ai_files if pydantic_ai_files else None,
+            )
+        except BaseException:
+            if title_task is not None:
+                title_task.cancel()
+            raise
+
+        ai_message = await self.message_repo.create_message_no_commit(
             thread_id=thread_id,
-            role="assistant",
+            role=MessageRole.ASSISTANT,
             content=full_response,
             tokens_used=tokens,
             model_used=settings.GEMINI_CHAT_MODEL,
             response_time_ms=time_ms,
         )
-        logger.debug(f"Saved AI message: {ai_message.id} ({tokens} tokens, {time_ms}ms)")
-
-        # Check if we need to generate title BEFORE incrementing count
-        should_generate_title = thread.message_count == 0
-
-        await self.thread_repo.increment_message_count_no_commit(thread_id, count=2)
-        await self.thread_repo.touch_no_commit(thread_id)
-
-        if should_generate_title:
-            title = await self.agent_service.generate_thread_title(content)
-            await self.thread_repo.update_title_no_commit(thread_id, title)
-            logger.debug(f"Generated thread title: {title}")
 
+        # Save the title with the counter when it finished during the stream; updated_at follows via onupdate
+        title = title_task.result() if title_task is not None and title_task.done() else None
+        msg_count = await self.thread_repo.update_after_message_no_commit(thread_id, count=2, title=title)
         await self.db.commit()
+        logger.debug(f"Saved AI message: {ai_message.id} ({tokens} tokens, {time_ms}ms)")
 
-        await websocket.send_json(
+        await send_json(
+            websocket,
             {
                 "type": "message_complete",
-                "message_id": str(ai_message.id),
-                "thread_id": str(thread_id),
+                "message_id": ai_message.id,
+                "thread_id": thread_id,
                 "tokens_used": tokens,
                 "response_time_ms": time_ms,
-            }
+            },
         )
 
-        msg_count = await self.message_repo.count_thread_messages(thread_id)
-        if msg_count >= settings.CHAT_SUMMARY_TRIGGER_COUNT:
-            logger.info(f"Thread {thread_id} has {msg_count} messages, generating summary...")
-            try:
-                # Get messages for summary
-                messages = await self.message_repo.get_thread_messages(thread_id, limit=50)
-
-                # Format messages for AI
-                message_dicts = [{"role": msg.sender, "content": msg.content} for msg in messages]
-
-                # Generate summary
-                summary_text = await self.agent_service.generate_thread_summary(message_dicts)
-
-                # Save summary to database
-                if messages:
-                    await self.summary_repo.create_summary(
-                        thread_id=thread_id,
-                        message_start_id=messages[-1].id,
-                        message_end_id=messages[0].id,
-                        message_count=len(messages),
-                        summary=summary_text,
-                        model_used=settings.GEMINI_MODEL_LOW,
-                    )
-                    logger.info(f"Summary created for thread {thread_id}")
-            except Exception as e:
-                logger.error(f"Failed to generate summary for thread {thread_id}: {e}", exc_info=True)
+        if title_task is not None and title is None:
+            title = await title_task
+            await self.thread_repo.update_title_no_commit(thread_id, title)
+            await self.db.commit()
+        if title is not None:
+            logger.debug(f"Generated thread title: {title}")
+
+        if msg_count is not None and msg_count >= settings.CHAT_SUMMARY_TRIGGER_COUNT:
+            await self._schedule_summary(thread_id, msg_count)
 
         return {"thread_id": str(thread_id), "message_id": str(ai_message.id)}
 
+    async def _load_thread_and_instructions(
+        self, thread_id: uuid.UUID | None, user: User
+    ) -> tuple["ChatThread | None", str]:
+        """Check the user owns the thread, then build the system instructions with its summary.
+
+        Args:
+            thread_id: Existing thread UUID or None for a new thread
+            user: Current user
+
+        Returns:
+            tuple: (thread or None for a new thread, system instructions)
+
+        Raises:
+            NotFoundError: If the thread doesn't exist or belongs to another user
+        """
+        thread = None
+        if thread_id:
+            # Ownership is checked before the thread's summary is read into the instructions
+            thread = await self.thread_repo.get_user_thread(thread_id, user.id)
+            if not thread:
+                raise NotFoundError("Thread not found or access denied")
+
+        return thread, await self.context_service.build_system_instructions(thread_id, user)
+
+    async def _schedule_summary(self, thread_id: uuid.UUID, msg_count: int) -> None:
+        """Queue a background summary unless one was queued within the debounce window.
+
+        Args:
+            thread_id: Thread UUID to summarize
+            msg_count: Current message count (for logging)
+        """
+        try:
+            queued = await redis_service.set_if_absent(
+                f"{SUMMARY_DEBOUNCE_PREFIX}:{thread_id}", 1, settings.CHAT_SUMMARY_DEBOUNCE_SECONDS
+            )
+            if not queued:
+                return
+            await run_in_threadpool(summarize_thread.delay, str(thread_id))
+            logger.info(f"Thread {thread_id} has {msg_count} messages, summary queued")
+        except Exception as e:
+            logger.error(f"Failed to queue summary for thread {thread_id}: {e}", exc_info=True)
+
     async def handle_load_thread(self, user: User, thread_id: uuid.UUID, before_timestamp: datetime | None) -> dict:
         """Load thread messages with cursor pagination.
 
@@ -265,16 +342,22 @@ class ChatService:
             thread_id=thread_id, limit=50, before_timestamp=before_timestamp
         )
 
+        # Sign every attachment URL in one batch (1 hour expiry), in message/media order
+        signed_urls = iter(
+            await storage_service.generate_signed_urls(
+                [media.storage_path for msg in messages for media in msg.media], expiration_minutes=60
+            )
+        )
+
         # Build messages with signed URLs for attachments
         message_list = []
         for msg in messages:
             attachments = []
             for media in msg.media:
-                # Generate signed URL for secure access (1 hour expiry)
-                signed_url = await storage_service.generate_signed_url(media.storage_path, expiration_minutes=60)
+                signed_url = next(signed_urls)
                 attachments.append(
                     {
-                        "id": str(media.id),
+                        "id": media.id,
                         "filename": media.original_filename,
                         "url": signed_url,
                         "mime_type": media.mime_type,
@@ -284,7 +367,7 @@ class ChatService:
 
             message_list.append(
                 {
-                    "id": str(msg.id),
+                    "id": msg.id,
                     "role": msg.role,
                     "content": msg.content,
                     "created_at": msg.created_at.isoformat(),
@@ -293,7 +376,7 @@ class ChatService:
             )
 
         return {
-            "thread_id": str(thread_id),
+            "thread_id": thread_id,
             "messages": message_list,
             "has_more": len(messages) == 50,
         }
@@ -314,13 +397,14 @@ class ChatService:
         threads = await self.thread_repo.get_by_user(user_id=user.id, include_archived=False, skip=skip, limit=limit)
 
         total = await self.thread_repo.count_user_threads(user.id)
+        last_messages = await self.message_repo.get_last_messages([thread.id for thread in threads])
 
         thread_list = []
         for thread in threads:
-            last_msg = thread.messages[-1] if thread.messages else None
+            last_msg = last_messages.get(thread.id)
             thread_list.append(
                 {
-                    "id": str(thread.id),
+                    "id": thread.id,
                     "title": thread.title,
                     "last_message": last_msg.content[:100] if last_msg else "",
                     "updated_at": thread.updated_at.isoformat(),
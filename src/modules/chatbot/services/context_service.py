@@ -4,15 +4,32 @@ Build AI context from thread history and optional user data.
 This service is designed to be generic and easily extensible.
 """
 
+import asyncio
 import uuid
 from typing import Protocol
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.logging import get_logger
+from src.core.utils.cache import TTLCache
 from src.modules.chatbot.constants import CONTEXT_TEMPLATES, build_system_prompt
 from src.modules.chatbot.repositories import MessageRepository, SummaryRepository
 from src.modules.users.models import User
 
+logger = get_logger(__name__)
+
+# Everything here is built from module constants, so resolve it once at import
+_BASE_SYSTEM_PROMPT = build_system_prompt()
+_SUMMARY_TEMPLATE = CONTEXT_TEMPLATES["conversation_summary"]
+_USER_CONTEXT_TEMPLATE = CONTEXT_TEMPLATES["user_context"]
+_CUSTOM_INSTRUCTIONS_TEMPLATE = CONTEXT_TEMPLATES["custom_instructions"]
+
+# Latest summary text per thread ("" when there is none). Summaries are written by the
+# Celery worker at most every few minutes, so a short TTL is the only invalidation needed.
+SUMMARY_CACHE_TTL_SECONDS = 60
+
+_summary_cache: TTLCache[uuid.UUID, str] = TTLCache(maxsize=2048, ttl=SUMMARY_CACHE_TTL_SECONDS)
+
 
 class ContextProvider(Protocol):
     """Protocol for custom context providers.
@@ -20,18 +37,20 @@ class ContextProvider(Protocol):
     Implement this protocol to add custom context to the AI.
     Examples: health data, user preferences, subscription info, etc.
 
+    Providers are called concurrently with each other and with the summary
+    query, so a provider that needs the database must open its own session
+    (an AsyncSession does not allow concurrent operations).
+
     Example:
         class HealthContextProvider:
-            def __init__(self, db: AsyncSession):
-                self.db = db
-
             async def get_context(self, user: User) -> str:
-                # Fetch and format health data
-                return "User's health summary..."
+                async with AsyncSessionLocal() as session:
+                    # Fetch and format health data
+                    return "User's health summary..."
 
         # Register in ChatContextService
         service = ChatContextService(db)
-        service.register_provider("health", HealthContextProvider(db))
+        service.register_provider("health", HealthContextProvider())
     """
 
     async def get_context(self, user: User) -> str:
@@ -60,8 +79,8 @@ class ChatContextService:
     Example:
         service = ChatContextService(db)
 
-        # Add custom context provider
-        service.register_provider("user_prefs", UserPreferencesProvider(db))
+        # Add custom context provider (it opens its own AsyncSessionLocal() session)
+        service.register_provider("user_prefs", UserPreferencesProvider())
 
         # Build system instructions
         instructions = await service.build_system_instructions(thread_id, user)
@@ -81,8 +100,9 @@ class ChatContextService:
             provider: Provider instance implementing ContextProvider protocol
 
         Example:
-            service.register_provider("health", HealthDataProvider(db))
-            service.register_provider("subscription", SubscriptionProvider(db))
+            # Providers run concurrently, so each opens its own AsyncSessionLocal() session
+            service.register_provider("health", HealthDataProvider())
+            service.register_provider("subscription", SubscriptionProvider())
         """
         self._context_providers[name] = provider
 
@@ -96,7 +116,7 @@ class ChatContextService:
 
     async def build_system_instructions(
         self,
-        thread_id: uuid.UUID,
+        thread_id: uuid.UUID | None,
         user: User,
         include_summary: bool = True,
         include_providers: bool = True,
@@ -111,7 +131,7 @@ class ChatContextService:
         - Additional context (if provided)
 
         Args:
-            thread_id: Thread UUID to load summary from
+            thread_id: Thread UUID to load summary from (None for a thread not created yet)
             user: Current user for context
             include_summary: Whether to include conversation summary
             include_providers: Whether to include registered provider contexts
@@ -120,37 +140,59 @@ class ChatContextService:
         Returns:
             Combined system instructions string
         """
+        # A thread that doesn't exist yet has no summary
+        summary_thread_id = thread_id if include_summary else None
+
+        # Nothing to add to the base prompt, so skip the gather and join entirely
+        if summary_thread_id is None and not (include_providers and self._context_providers) and not additional_context:
+            return _BASE_SYSTEM_PROMPT
+
         instructions_parts: list[str] = []
 
         # Base system prompt from constants
-        instructions_parts.append(build_system_prompt())
+        instructions_parts.append(_BASE_SYSTEM_PROMPT)
+
+        # The summary and all provider contexts are fetched concurrently
+        providers = self._context_providers if include_providers else {}
+        summary, *contexts = await asyncio.gather(
+            self._get_summary_text(summary_thread_id) if summary_thread_id is not None else _no_summary(),
+            *(provider.get_context(user) for provider in providers.values()),
+            return_exceptions=True,
+        )
 
         # Conversation summary
-        if include_summary:
-            summary = await self.summary_repo.get_latest(thread_id)
-            if summary:
-                formatted = CONTEXT_TEMPLATES["conversation_summary"].format(summary=summary.summary)
-                instructions_parts.append(formatted)
+        if isinstance(summary, BaseException):
+            raise summary
+        if summary:
+            formatted = _SUMMARY_TEMPLATE.format(summary=summary)
+            instructions_parts.append(formatted)
 
-        # Context from registered providers
-        if include_providers and self._context_providers:
-            for _name, provider in self._context_providers.items():
-                try:
-                    context = await provider.get_context(user)
-                    if context and context.strip():
-                        formatted = CONTEXT_TEMPLATES["user_context"].format(context=context)
-                        instructions_parts.append(formatted)
-                except Exception:
-                    # Log error but continue - don't break the chat
-                    pass
+        # Context from registered providers, in registration order
+        for name, context in zip(providers, contexts, strict=True):
+            if isinstance(context, BaseException):
+                # Log error but continue - don't break the chat
+                logger.warning(f"Context provider {name} failed: {context}")
+                continue
+            if context and context.strip():
+                formatted = _USER_CONTEXT_TEMPLATE.format(context=context)
+                instructions_parts.append(formatted)
 
         # Additional context passed directly
         if additional_context:
-            formatted = CONTEXT_TEMPLATES["custom_instructions"].format(instructions=additional_context)
+            formatted = _CUSTOM_INSTRUCTIONS_TEMPLATE.format(instructions=additional_context)
             instructions_parts.append(formatted)
 
         return "\n".join(instructions_parts)
 
+    async def _get_summary_text(self, thread_id: uuid.UUID) -> str:
+        """Get the thread's latest summary text, served from a short-lived cache."""
+        text = _summary_cache.get(thread_id)
+        if text is None:
+            summary = await self.summary_repo.get_latest(thread_id)
+            text = summary.summary if summary else ""
+            _summary_cache.set(thread_id, text)
+        return text
+
     async def build_minimal_instructions(self) -> str:
         """Build minimal system instructions without any context.
 
@@ -159,7 +201,7 @@ class ChatContextService:
         Returns:
             Base system prompt only
         """
-        return build_system_prompt()
+        return _BASE_SYSTEM_PROMPT
 
     async def get_user_context_summary(self, user: User) -> dict[str, str]:
         """Get all context provider outputs for debugging/display.
@@ -170,13 +212,21 @@ class ChatContextService:
         Returns:
             Dict mapping provider name to context string
         """
+        contexts = await asyncio.gather(
+            *(provider.get_context(user) for provider in self._context_providers.values()),
+            return_exceptions=True,
+        )
+
         results: dict[str, str] = {}
 
-        for name, provider in self._context_providers.items():
-            try:
-                context = await provider.get_context(user)
+        for name, context in zip(self._context_providers, contexts, strict=True):
+            if isinstance(context, BaseException):
+                results[name] = f"(error: {context})"
+            else:
                 results[name] = context if context else "(empty)"
-            except Exception as e:
-                results[name] = f"(error: {e})"
 
         return results
+
+
+async def _no_summary() -> None:
+    return None
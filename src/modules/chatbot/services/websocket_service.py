@@ -5,7 +5,7 @@ Handles WebSocket connection lifecycle and message routing for the chatbot.
 
 import uuid
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastapi import WebSocket
 
@@ -19,6 +19,9 @@ from src.core.websocket import (
 )
 from src.modules.chatbot.services.chat_service import ChatService
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
 logger = get_logger(__name__)
 
 
@@ -37,6 +40,14 @@ class ChatWebSocketHandler(BaseWebSocketHandler):
     def __init__(self, websocket: WebSocket, token: str):
         super().__init__(websocket, token)
         self._chat_service: ChatService | None = None
+        # Clients usually keep talking to one thread, so remember the last parsed id
+        self._last_thread_id: tuple[str, uuid.UUID] | None = None
+        self._handlers: dict[str, Callable[[dict[str, Any]], Awaitable[None]]] = {
+            "send_message": self._handle_send_message,
+            "load_thread": self._handle_load_thread,
+            "list_threads": self._handle_list_threads,
+            "ping": self._handle_ping,
+        }
 
     @property
     def chat_service(self) -> ChatService:
@@ -51,13 +62,30 @@ class ChatWebSocketHandler(BaseWebSocketHandler):
             self._chat_service = ChatService(self.db)
         return self._chat_service
 
+    def _parse_thread_id(self, value: str) -> uuid.UUID:
+        """Parse a thread_id field, reusing the previous result for a repeated id."""
+        if self._last_thread_id is not None and self._last_thread_id[0] == value:
+            return self._last_thread_id[1]
+
+        try:
+            thread_id = uuid.UUID(value)
+        except ValueError:
+            raise WebSocketValidationError(
+                message="Invalid thread_id format",
+                code=WebSocketErrorCode.INVALID_MESSAGE_FORMAT,
+                details={"field": "thread_id"},
+            )
+
+        self._last_thread_id = (value, thread_id)
+        return thread_id
+
     async def on_connect(self) -> None:
         """Send connected confirmation after authentication."""
         if self.user:
             await self.send(
                 {
                     "type": "connected",
-                    "user_id": str(self.user.id),
+                    "user_id": self.user.id,
                 }
             )
             logger.debug(f"[{self.conn_id}] Sent 'connected' message")
@@ -78,26 +106,17 @@ class ChatWebSocketHandler(BaseWebSocketHandler):
             WebSocketValidationError: If message type is invalid
         """
         msg_type = data.get("type")
+        handler = self._handlers.get(msg_type) if isinstance(msg_type, str) else None
 
-        if msg_type == "send_message":
-            await self._handle_send_message(data)
-
-        elif msg_type == "load_thread":
-            await self._handle_load_thread(data)
-
-        elif msg_type == "list_threads":
-            await self._handle_list_threads(data)
-
-        elif msg_type == "ping":
-            await self._handle_ping()
-
-        else:
+        if handler is None:
             raise WebSocketValidationError(
                 message=f"Unknown message type: {msg_type}",
                 code=WebSocketErrorCode.INVALID_MESSAGE_TYPE,
                 details={"received_type": msg_type},
             )
 
+        await handler(data)
+
     async def _handle_send_message(self, data: dict[str, Any]) -> None:
         """Handle send_message: Send user message and stream AI response.
 
@@ -134,16 +153,7 @@ class ChatWebSocketHandler(BaseWebSocketHandler):
 
         # Parse optional fields
         thread_id_str = data.get("thread_id")
-        thread_id: uuid.UUID | None = None
-        if thread_id_str:
-            try:
-                thread_id = uuid.UUID(thread_id_str)
-            except ValueError:
-                raise WebSocketValidationError(
-                    message="Invalid thread_id format",
-                    code=WebSocketErrorCode.INVALID_MESSAGE_FORMAT,
-                    details={"field": "thread_id"},
-                )
+        thread_id = self._parse_thread_id(thread_id_str) if thread_id_str else None
         upload_ids = data.get("upload_ids", [])
 
         # Delegate to chat service
@@ -180,16 +190,7 @@ class ChatWebSocketHandler(BaseWebSocketHandler):
             )
 
         # Validate thread_id
-        thread_id_str = self.require_field(data, "thread_id")
-
-        try:
-            thread_id = uuid.UUID(thread_id_str)
-        except ValueError:
-            raise WebSocketValidationError(
-                message="Invalid thread_id format",
-                code=WebSocketErrorCode.INVALID_MESSAGE_FORMAT,
-                details={"field": "thread_id"},
-            )
+        thread_id = self._parse_thread_id(self.require_field(data, "thread_id"))
 
         # Parse optional before_timestamp
         before_ts_str = data.get("before_timestamp")
@@ -258,6 +259,6 @@ class ChatWebSocketHandler(BaseWebSocketHandler):
 
         await self.send({"type": "thread_list", **result})
 
-    async def _handle_ping(self) -> None:
+    async def _handle_ping(self, data: dict[str, Any]) -> None:
         """Handle ping: Keep-alive ping/pong."""
         await self.send({"type": "pong"})
@@ -0,0 +1,3 @@
+from src.modules.chatbot.tasks.summary_tasks import summarize_thread
+
+__all__ = ["summarize_thread"]
@@ -0,0 +1,52 @@
+"""Celery tasks for summarizing chat threads outside the WebSocket turn."""
+
+import uuid
+
+from src.core.celery import celery_app, run_async
+from src.core.config import settings
+from src.core.database import task_session
+from src.core.logging import get_logger
+from src.modules.chatbot.repositories import MessageRepository, SummaryRepository
+from src.modules.chatbot.services.agent_service import ChatAgentService
+
+logger = get_logger(__name__)
+
+
+async def _summarize_thread(thread_id: uuid.UUID) -> bool:
+    async with task_session() as session:
+        message_repo = MessageRepository(session)
+        messages = await message_repo.get_thread_messages(thread_id, limit=50)
+        if not messages:
+            return False
+
+        message_dicts = [{"role": msg.role.value, "content": msg.content} for msg in messages]
+        # Each task runs in its own event loop, so the process-wide agent's HTTP client can't be reused
+        summary_text = await ChatAgentService().generate_thread_summary(message_dicts)
+
+        await SummaryRepository(session).create_summary(
+            thread_id=thread_id,
+            message_start_id=messages[0].id,
+            message_end_id=messages[-1].id,
+            message_count=len(messages),
+            summary=summary_text,
+            model_used=settings.GEMINI_MODEL_LOW,
+        )
+        return True
+
+
+@celery_app.task(name="chat.summarize_thread")
+def summarize_thread(thread_id: str) -> dict[str, str | bool]:
+    """Generate and store a summary of a thread's latest messages.
+
+    Args:
+        thread_id: Thread UUID as a string
+
+    Returns:
+        Dictionary with the thread id and whether a summary was created
+    """
+    created = run_async(_summarize_thread(uuid.UUID(thread_id)))
+
+    if created:
+        logger.info(f"Summary created for thread {thread_id}")
+
+    return {"thread_id": thread_id, "created": created}
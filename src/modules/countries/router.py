@@ -1,6 +1,6 @@
 """Router for countries endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from src.modules.auth.dependencies import get_current_user
 from src.modules.countries.schemas import CountryListResponse, CountryResponse
@@ -19,7 +19,7 @@ router = APIRouter()
 async def get_countries(
     search: str | None = Query(default=None, max_length=100, description="Search countries by name"),
     current_user: User = Depends(dependency=get_current_user),  # noqa: ARG001
-) -> CountryListResponse:
+) -> CountryListResponse | Response:
     """
     Get all countries with their timezone info.
 
@@ -37,7 +37,8 @@ async def get_countries(
         filtered: list[CountryResponse] = service.search_countries(query=search)
         return CountryListResponse(countries=filtered, total=len(filtered))
 
-    return service.get_all_countries()
+    # Serialized once at load; bypasses response_model validation and encoding
+    return Response(content=service.get_all_countries_json(), media_type="application/json")
 
 
 @router.get(
@@ -1,7 +1,7 @@
 """Service for managing country data."""
 
+import asyncio
 import csv
-from csv import DictReader
 from pathlib import Path
 
 from src.core.logging import get_logger
@@ -9,15 +9,23 @@ from src.modules.countries.schemas import CountryListResponse, CountryResponse
 
 logger = get_logger(__name__)
 
+FLAG_BASE_URL = "https://flagcdn.com/w320/"
+
 _countries_cache: CountryListResponse | None = None
+# The full list rendered as the JSON response body, built together with _countries_cache
+_countries_json: bytes = b""
+# ISO code -> country and lowercased names (parallel to the cached list), built together with _countries_cache
+_code_index: dict[str, CountryResponse] = {}
+_lower_names: list[str] = []
 
 
-def initialize_countries_cache() -> None:
+async def initialize_countries_cache() -> None:
     """
     Initialize countries cache at application startup.
 
     This prevents blocking I/O during request validation by pre-loading
-    all country data into memory (~25KB).
+    all country data into memory (~25KB). The CSV is read and parsed in a
+    worker thread so startup doesn't block the event loop.
 
     Called by FastAPI lifespan event in main.py.
     """
@@ -29,7 +37,7 @@ def initialize_countries_cache() -> None:
 
     logger.info("Initializing countries cache at startup...")
     service = CountryService()
-    _ = service.get_all_countries()  # This will populate _countries_cache
+    await asyncio.to_thread(service.get_all_countries)  # This will populate _countries_cache
     logger.info(f"Countries cache initialized with {_countries_cache.total if _countries_cache else 0} countries")
 
 
@@ -46,19 +54,11 @@ def get_country_by_code_cached(code: str) -> CountryResponse | None:
     Returns:
         Country if found in cache, None if cache not initialized or country not found
     """
-    global _countries_cache
-
     if _countries_cache is None:
         logger.warning(msg="Countries cache not initialized - validation may fail")
         return None
 
-    code_upper: str = code.upper()
-
-    for country in _countries_cache.countries:
-        if country.code == code_upper:
-            return country
-
-    return None
+    return _code_index.get(code.upper())
 
 
 class CountryService:
@@ -78,7 +78,7 @@ class CountryService:
         Returns:
             CountryListResponse with all countries sorted by name
         """
-        global _countries_cache
+        global _countries_cache, _countries_json, _code_index, _lower_names
 
         if _countries_cache is not None:
             return _countries_cache
@@ -89,24 +89,50 @@ class CountryService:
         logger.info(f"Loading countries from {csv_path}")
 
         with csv_path.open(encoding="utf-8") as f:
-            reader: DictReader[str] = csv.DictReader(f)
+            # Plain rows indexed by header position instead of a dict per row
+            reader = csv.reader(f)
+            header: list[str] = next(reader)
+            name_idx = header.index("Name")
+            code_idx = header.index("Code")
+            tz_idx = header.index("Timezone") if "Timezone" in header else None
+
             for row in reader:
-                name: str = row["Name"]
-                code: str = row["Code"]
-                timezone: str = row.get("Timezone", "UTC")
+                name: str = row[name_idx]
+                code: str = row[code_idx]
+                timezone: str = row[tz_idx] if tz_idx is not None and tz_idx < len(row) and row[tz_idx] else "UTC"
 
-                flag_url = f"https://flagcdn.com/w320/{code.lower()}.png"
+                flag_url = f"{FLAG_BASE_URL}{code.lower()}.png"
 
-                countries.append(CountryResponse(name=name, code=code, timezone=timezone, flag_url=flag_url))
+                # Bundled data with plain string columns, so skip per-field validation
+                countries.append(
+                    CountryResponse.model_construct(name=name, code=code, timezone=timezone, flag_url=flag_url)
+                )
 
         countries.sort(key=lambda x: x.name)
 
         logger.info(f"Loaded {len(countries)} countries")
 
-        _countries_cache = CountryListResponse(countries=countries, total=len(countries))
+        _code_index = {country.code: country for country in countries}
+        _lower_names = [country.name.lower() for country in countries]
+        _countries_cache = CountryListResponse.model_construct(countries=countries, total=len(countries))
+        _countries_json = _countries_cache.model_dump_json().encode()
 
         return _countries_cache
 
+    def get_all_countries_json(self) -> bytes:
+        """
+        Get all countries as a pre-serialized JSON body.
+
+        The unfiltered list never changes at runtime, so it is serialized once
+        instead of on every request.
+
+        Returns:
+            CountryListResponse rendered as UTF-8 JSON
+        """
+        self.get_all_countries()  # Builds _countries_json on first use
+
+        return _countries_json
+
     def search_countries(self, query: str) -> list[CountryResponse]:
         """
         Search countries by name (case-insensitive).
@@ -121,7 +147,9 @@ class CountryService:
         query_lower: str = query.lower()
 
         filtered: list[CountryResponse] = [
-            country for country in all_data.countries if query_lower in country.name.lower()
+            country
+            for country, name_lower in zip(all_data.countries, _lower_names, strict=True)
+            if query_lower in name_lower
         ]
 
         logger.debug(f"Search '{query}' found {len(filtered)} countries")
@@ -138,11 +166,6 @@ class CountryService:
         Returns:
             Country if found, None otherwise
         """
-        all_data: CountryListResponse = self.get_all_countries()
-        code_upper: str = code.upper()
+        self.get_all_countries()  # Builds _code_index on first use
 
-        for country in all_data.countries:
-            if country.code == code_upper:
-                return country
-
-        return None
+        return _code_index.get(code.upper())
@@ -1,10 +1,20 @@
-from fastapi import APIRouter, status
+import asyncio
+
+from fastapi import APIRouter, Depends, Response, status
 
 from src.modules.health.schemas import HealthCheckResponse, LivenessResponse, ReadinessResponse
-from src.modules.health.service import HealthCheckService
+from src.modules.health.service import HEALTH_CACHE_TTL_SECONDS, HealthCheckService, get_health_check_service
 
 router = APIRouter(prefix="/api/v1/health", tags=["Health"])
 
+# Probe answers never change, so they are built once instead of on every poll
+_LIVE = LivenessResponse(status="ok")
+_READY = ReadinessResponse(status="ready", ready=True)
+_NOT_READY = ReadinessResponse(status="not_ready", ready=False)
+
+# Probes still running after readiness answered early; referenced here so they aren't garbage collected
+_pending_probes: set[asyncio.Task] = set()
+
 
 @router.get(
     "/",
@@ -13,21 +23,26 @@ router = APIRouter(prefix="/api/v1/health", tags=["Health"])
     summary="Complete Health Check",
     description="Check health status of all system components including database, redis, and storage.",
 )
-async def health_check():
+async def health_check(
+    response: Response,
+    service: HealthCheckService = Depends(get_health_check_service),
+):
     """
     Comprehensive health check endpoint.
 
     Returns detailed status for:
     - Database (PostgreSQL)
     - Cache (Redis)
-    - Storage (Google Cloud Storage)
+    - Storage (Google Cloud Storage, if STORAGE_HEALTHCHECK_ENABLED; cached for 60s)
 
     Status values:
     - healthy: All services operational
     - degraded: Some services down
     - unhealthy: All services down
+
+    Results are cached for a few seconds to absorb frequent polling.
     """
-    service = HealthCheckService()
+    response.headers["Cache-Control"] = f"max-age={int(HEALTH_CACHE_TTL_SECONDS)}"
     return await service.get_health_status()
 
 
@@ -45,7 +60,7 @@ async def liveness():
     Returns 200 if application is alive and running.
     Does not check external dependencies.
     """
-    return LivenessResponse(status="ok")
+    return _LIVE
 
 
 @router.get(
@@ -55,26 +70,23 @@ async def liveness():
     summary="Readiness Probe",
     description="Check if application is ready to serve requests.",
 )
-async def readiness():
+async def readiness(service: HealthCheckService = Depends(get_health_check_service)):
     """
     Kubernetes readiness probe endpoint.
 
     Checks critical dependencies (database, redis).
     Returns 200 if ready, 503 if not ready.
     """
-    service = HealthCheckService()
-    db_status = await service.check_database()
-    redis_status = await service.check_redis()
-
-    ready = db_status.status == "healthy" and redis_status.status == "healthy"
-
-    if not ready:
-        return ReadinessResponse(
-            status="not_ready",
-            ready=False,
-        )
-
-    return ReadinessResponse(
-        status="ready",
-        ready=True,
-    )
+    # Probe both concurrently and answer as soon as one is unhealthy instead of waiting out the other.
+    # The other probe is left to finish (it is bounded by the probe timeout) so it can fill the shared
+    # probe cache; cancelling it could interrupt it mid-connect or while it holds the probe lock.
+    probes = [asyncio.create_task(service.check_database()), asyncio.create_task(service.check_redis())]
+    for probe in asyncio.as_completed(probes):
+        if (await probe).status != "healthy":
+            for task in probes:
+                if not task.done():
+                    _pending_probes.add(task)
+                    task.add_done_callback(_pending_probes.discard)
+            return _NOT_READY
+
+    return _READY
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 
 class ServiceStatus(BaseModel):
@@ -9,6 +9,11 @@ class ServiceStatus(BaseModel):
     message: str | None = Field(None, description="Additional status information")
     response_time_ms: float | None = Field(None, description="Response time in milliseconds")
 
+    @field_serializer("response_time_ms")
+    def round_response_time(self, value: float | None) -> float | None:
+        """Round to two decimals only when the status is serialized."""
+        return round(value, 2) if value is not None else None
+
 
 class HealthCheckResponse(BaseModel):
     """Complete health check response."""
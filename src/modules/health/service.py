@@ -1,117 +1,209 @@
+import asyncio
+import functools
 import time
+from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime
+from typing import Any, cast
 
-from google.cloud import storage
-from redis.asyncio import Redis
 from sqlalchemy import text
 
 from src.core.config import settings
-from src.core.database import AsyncSessionLocal
+from src.core.database import engine
 from src.core.logging import get_logger
+from src.core.services.redis_service import redis_service
+from src.core.services.storage import storage_service
 from src.modules.health.schemas import HealthCheckResponse, ServiceStatus
 
 logger = get_logger(__name__)
 
+# Monitors and load balancers poll the full health check every few seconds; within this window
+# they get the last result instead of triggering another round of probes
+HEALTH_CACHE_TTL_SECONDS = 5.0
+
+_cached_health: tuple[float, HealthCheckResponse] | None = None
+
+# /live, /ready and /health are often polled within the same second; probe results are shared for this long
+PROBE_CACHE_TTL_SECONDS = 2.0
+
+# GCS is the slowest probe and not needed to serve most requests, so its result is kept longer
+STORAGE_HEALTH_CACHE_TTL_SECONDS = 60.0
+
+_PING_QUERY = text("SELECT 1")
+
+# Upper bound for each dependency probe, so a hung connection reports unhealthy instead of stalling the endpoint
+HEALTH_PROBE_TIMEOUT_SECONDS = 2.0
+
+# Health timestamps only need second resolution, so the formatted string is reused within a second
+_timestamp_cache: tuple[int, str] = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string, truncated to the second."""
+    global _timestamp_cache
+
+    second = int(time.time())
+    if second != _timestamp_cache[0]:
+        _timestamp_cache = (second, datetime.fromtimestamp(second, tz=UTC).isoformat())
+    return _timestamp_cache[1]
+
+
+def _describe_error(error: Exception) -> str:
+    """Message for a failed probe (a bare TimeoutError has no text of its own)."""
+    return "timeout" if isinstance(error, TimeoutError) else str(error)
+
+
+type _Probe = Callable[..., Coroutine[Any, Any, ServiceStatus]]
+
+
+def _shared_probe[F: _Probe](ttl: float) -> Callable[[F], F]:
+    """Reuse a probe's result for ttl seconds and let concurrent callers share one probe.
+
+    Only the first caller after expiry hits the dependency; the others wait on the
+    lock and then read its result.
+    """
+
+    def decorator(probe: F) -> F:
+        cached: tuple[float, ServiceStatus] | None = None
+        lock = asyncio.Lock()
+
+        @functools.wraps(probe)
+        async def wrapper(self: Any) -> ServiceStatus:
+            nonlocal cached
+
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+            async with lock:
+                # Another caller may have refreshed the result while this one waited
+                if cached is not None and time.monotonic() - cached[0] < ttl:
+                    return cached[1]
+
+                result = await probe(self)
+                cached = (time.monotonic(), result)
+                return result
+
+        return cast("F", wrapper)
+
+    return decorator
+
 
 class HealthCheckService:
     """Service for checking health of all system components."""
 
+    @_shared_probe(PROBE_CACHE_TTL_SECONDS)
     async def check_database(self) -> ServiceStatus:
         """Check PostgreSQL database connectivity."""
         start = time.time()
         try:
-            async with AsyncSessionLocal() as session:
-                result = await session.execute(text("SELECT 1"))
-                result.scalar()
+            # A pooled connection is enough for SELECT 1; no need for a session and its ORM state
+            async with asyncio.timeout(HEALTH_PROBE_TIMEOUT_SECONDS), engine.connect() as conn:
+                await conn.execute(_PING_QUERY)
             response_time = (time.time() - start) * 1000
             return ServiceStatus(
                 name="database",
                 status="healthy",
                 message="PostgreSQL connection successful",
-                response_time_ms=round(response_time, 2),
+                response_time_ms=response_time,
             )
         except Exception as e:
             response_time = (time.time() - start) * 1000
-            logger.error(f"Database health check failed: {e}")
+            logger.error(f"Database health check failed: {_describe_error(e)}")
             return ServiceStatus(
                 name="database",
                 status="unhealthy",
-                message=f"Database connection failed: {e!s}",
-                response_time_ms=round(response_time, 2),
+                message=f"Database connection failed: {_describe_error(e)}",
+                response_time_ms=response_time,
             )
 
+    @_shared_probe(PROBE_CACHE_TTL_SECONDS)
     async def check_redis(self) -> ServiceStatus:
         """Check Redis connectivity."""
         start = time.time()
         try:
-            redis_client = Redis.from_url(
-                settings.REDIS_URL,
-                encoding="utf-8",
-                decode_responses=True,
-            )
-            await redis_client.ping()
-            await redis_client.aclose()
+            # Reuse the app-wide pool instead of paying a connect + AUTH handshake per probe;
+            # the pool drops broken connections on its own, so a failed ping recovers on the next one
+            async with asyncio.timeout(HEALTH_PROBE_TIMEOUT_SECONDS):
+                await redis_service.ping()
             response_time = (time.time() - start) * 1000
             return ServiceStatus(
                 name="redis",
                 status="healthy",
                 message="Redis connection successful",
-                response_time_ms=round(response_time, 2),
+                response_time_ms=response_time,
             )
         except Exception as e:
             response_time = (time.time() - start) * 1000
-            logger.error(f"Redis health check failed: {e}")
+            logger.error(f"Redis health check failed: {_describe_error(e)}")
             return ServiceStatus(
                 name="redis",
                 status="unhealthy",
-                message=f"Redis connection failed: {e!s}",
-                response_time_ms=round(response_time, 2),
+                message=f"Redis connection failed: {_describe_error(e)}",
+                response_time_ms=response_time,
             )
 
+    @_shared_probe(STORAGE_HEALTH_CACHE_TTL_SECONDS)
     async def check_storage(self) -> ServiceStatus:
-        """Check Google Cloud Storage connectivity."""
+        """Check Google Cloud Storage connectivity.
+
+        Only the full health check calls this (readiness skips it); the result
+        is reused for STORAGE_HEALTH_CACHE_TTL_SECONDS.
+        """
         start = time.time()
         try:
-            client = storage.Client()
-            # Just list buckets to verify credentials and connectivity
-            list(client.list_buckets(max_results=1))
+            # The GCS client is blocking, so run it off the event loop to keep the other probes concurrent
+            async with asyncio.timeout(HEALTH_PROBE_TIMEOUT_SECONDS):
+                exists = await asyncio.to_thread(self._private_bucket_exists)
+            if not exists:
+                raise ValueError(f"Bucket {settings.PRIVATE_BUCKET_NAME} not found")
             response_time = (time.time() - start) * 1000
             return ServiceStatus(
                 name="storage",
                 status="healthy",
                 message="Google Cloud Storage connection successful",
-                response_time_ms=round(response_time, 2),
+                response_time_ms=response_time,
             )
         except Exception as e:
             response_time = (time.time() - start) * 1000
-            logger.error(f"Storage health check failed: {e}")
+            logger.error(f"Storage health check failed: {_describe_error(e)}")
             return ServiceStatus(
                 name="storage",
                 status="unhealthy",
-                message=f"Storage connection failed: {e!s}",
-                response_time_ms=round(response_time, 2),
+                message=f"Storage connection failed: {_describe_error(e)}",
+                response_time_ms=response_time,
             )
 
+    @staticmethod
+    def _private_bucket_exists() -> bool:
+        """Fetch the private bucket's metadata with the app's shared GCS client."""
+        return storage_service.client.bucket(settings.PRIVATE_BUCKET_NAME).exists()
+
     async def get_health_status(self) -> HealthCheckResponse:
         """
         Get comprehensive health status of all services.
 
+        The result is reused for HEALTH_CACHE_TTL_SECONDS.
+
         Returns:
             HealthCheckResponse with overall status and individual service statuses.
         """
-        # Check all services
-        db_status = await self.check_database()
-        redis_status = await self.check_redis()
-        storage_status = await self.check_storage()
+        global _cached_health
+
+        if _cached_health is not None and time.monotonic() - _cached_health[0] < HEALTH_CACHE_TTL_SECONDS:
+            return _cached_health[1]
+
+        # Check all services concurrently; each probe reports its own failures as "unhealthy"
+        probes = {"database": self.check_database(), "redis": self.check_redis()}
+        if settings.STORAGE_HEALTHCHECK_ENABLED:
+            probes["storage"] = self.check_storage()
 
-        services = {
-            "database": db_status,
-            "redis": redis_status,
-            "storage": storage_status,
-        }
+        # Count unhealthy services in the same pass that collects the results
+        services: dict[str, ServiceStatus] = {}
+        unhealthy_count = 0
+        for name, service_status in zip(probes, await asyncio.gather(*probes.values()), strict=True):
+            services[name] = service_status
+            unhealthy_count += service_status.status == "unhealthy"
 
         # Determine overall status
-        unhealthy_count = sum(1 for s in services.values() if s.status == "unhealthy")
         if unhealthy_count == 0:
             overall_status = "healthy"
         elif unhealthy_count == len(services):
@@ -119,10 +211,19 @@ class HealthCheckService:
         else:
             overall_status = "degraded"
 
-        return HealthCheckResponse(
+        response = HealthCheckResponse(
             status=overall_status,
             version="1.0.0",
             environment=settings.ENVIRONMENT,
             services=services,
-            timestamp=datetime.now(tz=UTC).isoformat(),
+            timestamp=_utc_timestamp(),
         )
+        _cached_health = (time.monotonic(), response)
+        return response
+
+
+health_check_service = HealthCheckService()
+
+
+async def get_health_check_service() -> HealthCheckService:
+    return health_check_service
@@ -1,12 +1,21 @@
 """User repository for authentication and user management."""
 
-from sqlalchemy import select
+from typing import Any
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.enums import AuthProviderEnum
 from src.core.repository import BaseRepository
 from src.modules.users.models import User
 
+# Login lookups run on every auth request, so their statements are built once and only the values are bound per call
+_BY_EMAIL_STMT = select(User).where(User.email == bindparam("email"))
+_BY_SOCIAL_ID_STMT = select(User).where(
+    User.provider == bindparam("provider"), User.social_id == bindparam("social_id")
+)
+
 
 class UserRepository(BaseRepository[User]):
     """Repository for User model operations."""
@@ -23,8 +32,7 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User if found, None otherwise
         """
-        statement = select(self.model).where(self.model.email == email)
-        result = await self.db.scalar(statement)
+        result = await self.db.scalar(_BY_EMAIL_STMT, {"email": email})
         return result
 
     async def get_by_social_id(self, social_id: str, provider: AuthProviderEnum) -> User | None:
@@ -37,6 +45,64 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User if found, None otherwise
         """
-        statement = select(self.model).where(self.model.provider == provider).where(self.model.social_id == social_id)
-        result = await self.db.scalar(statement)
+        result = await self.db.scalar(_BY_SOCIAL_ID_STMT, {"provider": provider, "social_id": social_id})
         return result
+
+    async def update_by_id(self, user_id: Any, values: dict[str, Any]) -> User | None:
+        """Update a user's columns and return the updated row in one UPDATE ... RETURNING.
+
+        Args:
+            user_id: User ID
+            values: Column values to set
+
+        Returns:
+            The updated user, or None if no user has this ID
+        """
+        statement = update(self.model).where(self.model.id == user_id).values(**values).returning(self.model)
+        result = await self.db.scalars(statement, execution_options={"populate_existing": True})
+        user = result.one_or_none()
+        await self.db.commit()
+        return user
+
+    async def upsert_social(
+        self,
+        email: str,
+        social_id: str,
+        provider: AuthProviderEnum,
+        full_name: str | None = None,
+        profile_image: str | None = None,
+    ) -> User | None:
+        """Create a social user, or link the existing unlinked account with this email, in one statement.
+
+        Args:
+            email: Email address reported by the provider
+            social_id: Social provider user ID
+            provider: Auth provider (GOOGLE, APPLE, etc.)
+            full_name: Name for a newly created user
+            profile_image: Profile image URL for a newly created user
+
+        Returns:
+            The created or linked user, or None if the email belongs to an account
+            already linked to another social ID
+        """
+        statement = (
+            insert(self.model)
+            .values(
+                email=email,
+                social_id=social_id,
+                provider=provider,
+                full_name=full_name,
+                profile_image=profile_image,
+                is_active=True,
+            )
+            .on_conflict_do_update(
+                index_elements=[self.model.email],
+                set_={"social_id": social_id, "provider": provider},
+                where=self.model.social_id.is_(None),
+            )
+            .returning(self.model)
+        )
+        result = await self.db.scalars(statement, execution_options={"populate_existing": True})
+        user = result.one_or_none()
+        await self.db.commit()
+        return user
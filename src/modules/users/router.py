@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
+from src.core.services.redis_service import RedisService, get_redis_service
 from src.modules.auth.dependencies import get_current_user
 from src.modules.users.models import User
 from src.modules.users.schemas import UserResponse, UserUpdate
@@ -10,9 +11,28 @@ from src.modules.users.service import UserService
 router = APIRouter()
 
 
+def _user_response(user: User) -> Response:
+    """Serialize a user loaded from our own database without re-validating it.
+
+    Returning a Response skips FastAPI's response_model validation (EmailStr
+    in particular); response_model still documents the shape.
+    """
+    body = UserResponse.model_construct(
+        id=str(user.id),
+        email=user.email,
+        full_name=user.full_name,
+        profile_image=user.profile_image,
+        is_active=user.is_active,
+        is_verified=user.is_verified,
+        provider=user.provider.value,
+        timezone=user.timezone,
+    )
+    return Response(content=body.model_dump_json(), media_type="application/json")
+
+
 @router.get("/me", response_model=UserResponse)
-async def get_me(current_user: User = Depends(get_current_user)):
-    return current_user
+async def get_me(current_user: User = Depends(get_current_user)) -> Response:
+    return _user_response(current_user)
 
 
 @router.patch("/me", response_model=UserResponse)
@@ -20,15 +40,17 @@ async def update_me(
     update_data: UserUpdate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-):
-    service = UserService(db)
-    return await service.update_profile(current_user.id, update_data)
+    redis: RedisService = Depends(get_redis_service),
+) -> Response:
+    service = UserService(db, redis)
+    return _user_response(await service.update_profile(current_user.id, update_data))
 
 
 @router.delete("/me", status_code=204)
 async def delete_me(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    redis: RedisService = Depends(get_redis_service),
 ):
-    service = UserService(db)
+    service = UserService(db, redis)
     await service.delete_account(current_user.id)
@@ -1,15 +1,18 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.exception import NotFoundError
+from src.core.services.redis_service import RedisService
+from src.modules.auth.dependencies import invalidate_cached_user
 from src.modules.users.models import User
 from src.modules.users.repository import UserRepository
 from src.modules.users.schemas import UserUpdate
 
 
 class UserService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, redis: RedisService):
         self.db = db
         self.user_repo = UserRepository(db)
+        self.redis: RedisService = redis
 
     async def get_profile(self, user_id) -> User:
         user = await self.user_repo.get(user_id)
@@ -18,22 +21,22 @@ class UserService:
         return user
 
     async def update_profile(self, user_id, update_data: UserUpdate) -> User:
-        user = await self.user_repo.get(user_id)
-        if not user:
-            raise NotFoundError("User not found")
-
         update_dict = update_data.model_dump(exclude_unset=True)
         if not update_dict:
-            return user
+            return await self.get_profile(user_id)
 
-        updated_user = await self.user_repo.update(user, update_dict)
+        updated_user = await self.user_repo.update_by_id(user_id, update_dict)
+        if not updated_user:
+            raise NotFoundError("User not found")
+        # Only after the commit, so no worker can re-cache the old row
+        await invalidate_cached_user(user_id, self.redis)
         return updated_user
 
     async def delete_account(self, user_id) -> None:
-        user = await self.user_repo.get(user_id)
-        if not user:
-            raise NotFoundError("User not found")
-
         # Deactivate user account (user can no longer log in)
         # To implement true soft delete with timestamp, add deleted_at field to User model
-        await self.user_repo.update(user, {"is_active": False})
+        user = await self.user_repo.update_by_id(user_id, {"is_active": False})
+        if not user:
+            raise NotFoundError("User not found")
+        # Only after the commit, so no worker can re-cache the still-active row
+        await invalidate_cached_user(user_id, self.redis)
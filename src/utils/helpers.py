@@ -1,11 +1,10 @@
-import random
-import string
+import secrets
 from datetime import datetime, timedelta
 
 
 def generate_verification_code(length: int = 4) -> str:
-    """Generate a numeric verification code of given length."""
-    return "".join(random.choices(string.digits, k=length))
+    """Generate a numeric verification code of given length (CSPRNG, zero-padded)."""
+    return f"{secrets.randbelow(10**length):0{length}d}"
 
 
 def get_code_expiration(minutes: int = 10) -> datetime:
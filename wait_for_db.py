@@ -6,6 +6,7 @@ Used in production deployments with Cloud SQL.
 """
 
 import asyncio
+import random
 import sys
 import time
 
@@ -15,13 +16,17 @@ from sqlalchemy.ext.asyncio import create_async_engine
 from src.core.config import settings
 
 
-async def wait_for_database(max_retries: int = 30, retry_interval: int = 2) -> bool:
+async def wait_for_database(max_retries: int = 30, initial_delay: float = 0.2, max_delay: float = 5.0) -> bool:
     """
     Wait for database connection to be ready.
 
+    Retries back off exponentially with jitter, so a database that is almost up
+    is picked up quickly while a slow one isn't polled every fraction of a second.
+
     Args:
         max_retries: Maximum number of connection attempts
-        retry_interval: Seconds to wait between attempts
+        initial_delay: Seconds to wait after the first failed attempt
+        max_delay: Upper bound for the wait between attempts
 
     Returns:
         True if connection successful, False otherwise
@@ -41,9 +46,10 @@ async def wait_for_database(max_retries: int = 30, retry_interval: int = 2) -> b
             return True
 
         except Exception as e:
-            print(f"Database is not ready yet... retrying in {retry_interval} seconds ({attempt}/{max_retries})")
+            delay = min(initial_delay * 2**attempt + random.uniform(0, 0.5), max_delay)
+            print(f"Database is not ready yet... retrying in {delay:.1f} seconds ({attempt}/{max_retries})")
             if attempt < max_retries - 1:
-                await asyncio.sleep(retry_interval)
+                await asyncio.sleep(delay)
             else:
                 print("Error: Could not connect to the database.")
                 print(f"Last error: {e}")